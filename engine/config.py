@@ -1,16 +1,25 @@
-"""Configuration loading from environment variables."""
+"""Configuration loading from environment variables.
+
+A .env file in the working directory (or the project root) is loaded first if
+one exists. Set AGENTSWARM_SKIP_DOTENV=1 to skip .env handling entirely, e.g.
+in deployments where config comes purely from the environment.
+"""
 
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta/openai"
 
 
+class ConfigError(RuntimeError):
+    """Raised when a required env var is missing or a value can't be parsed."""
+
+
 @dataclass(frozen=True)
 class LLMConfig:
     endpoint: str
@@ -29,32 +38,102 @@ class Config:
     max_planner_iterations: int
     reconciler_enabled: bool
     reconciler_interval_s: float
+    spec_cache_enabled: bool
+
+
+def load_config(env: Mapping[str, str] | None = None) -> Config:
+    """Load configuration from .env and environment variables.
+
+    The process environment is read once and memoized; call reload_config()
+    to pick up changes. If ``env`` is given it is used as-is (uncached) and
+    .env loading is skipped.
+    """
+    if env is not None:
+        return _config_from_env(env)
+    return _load_process_config()
+
+
+def reload_config() -> Config:
+    """Drop the memoized config and re-read .env and the environment."""
+    _load_process_config.cache_clear()
+    return _load_process_config()
+
+
+@lru_cache(maxsize=1)
+def _load_process_config() -> Config:
+    if os.environ.get("AGENTSWARM_SKIP_DOTENV") != "1":
+        _load_dotenv_if_present()
+    return _config_from_env(dict(os.environ))
 
 
-def load_config() -> Config:
-    """Load configuration from .env and environment variables."""
-    load_dotenv()
+def _load_dotenv_if_present() -> None:
+    """Load the first .env found; python-dotenv is only imported if there is one."""
+    for path in (Path.cwd() / ".env", Path(__file__).resolve().parent.parent / ".env"):
+        if path.is_file():
+            from dotenv import load_dotenv
 
-    api_key = os.environ.get("GEMINI_API_KEY")
+            load_dotenv(path)
+            return
+
+
+def _config_from_env(env: Mapping[str, str]) -> Config:
+    api_key = env.get("GEMINI_API_KEY")
     if not api_key:
-        raise RuntimeError("Missing required env: GEMINI_API_KEY")
+        raise ConfigError("Missing required env: GEMINI_API_KEY")
 
-    endpoint = os.environ.get("LLM_ENDPOINT", GEMINI_BASE_URL).rstrip("/")
+    endpoint = env.get("LLM_ENDPOINT", GEMINI_BASE_URL).rstrip("/")
 
     llm = LLMConfig(
         endpoint=endpoint,
         api_key=api_key,
-        model=os.environ.get("LLM_MODEL", "gemini-2.5-pro"),
-        max_tokens=int(os.environ.get("LLM_MAX_TOKENS", "65536")),
-        temperature=float(os.environ.get("LLM_TEMPERATURE", "0.7")),
-        timeout_s=float(os.environ.get("LLM_TIMEOUT_S", "300")),
+        model=env.get("LLM_MODEL", "gemini-2.5-pro"),
+        max_tokens=_env_int(env, "LLM_MAX_TOKENS", 65536),
+        temperature=_env_float(env, "LLM_TEMPERATURE", 0.7),
+        timeout_s=_env_float(env, "LLM_TIMEOUT_S", 300.0),
     )
 
     return Config(
         llm=llm,
-        output_dir=Path(os.environ.get("OUTPUT_DIR", "./output_project")),
-        max_workers=int(os.environ.get("MAX_WORKERS", "10")),
-        max_planner_iterations=int(os.environ.get("MAX_PLANNER_ITERATIONS", "100")),
-        reconciler_enabled=os.environ.get("RECONCILER_ENABLED", "true").lower() == "true",
-        reconciler_interval_s=float(os.environ.get("RECONCILER_INTERVAL_S", "120")),
+        output_dir=Path(env.get("OUTPUT_DIR", "./output_project")),
+        max_workers=_env_int(env, "MAX_WORKERS", 10),
+        max_planner_iterations=_env_int(env, "MAX_PLANNER_ITERATIONS", 100),
+        reconciler_enabled=_env_bool(env, "RECONCILER_ENABLED", True),
+        reconciler_interval_s=_env_float(env, "RECONCILER_INTERVAL_S", 120.0),
+        spec_cache_enabled=_env_bool(env, "SPEC_CACHE_ENABLED", False),
     )
+
+
+_TRUE_VALUES = {"true", "1", "yes", "on"}
+_FALSE_VALUES = {"false", "0", "no", "off", ""}
+
+
+def _env_int(env: Mapping[str, str], name: str, default: int) -> int:
+    raw = env.get(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ConfigError(f"Invalid integer for {name}: {raw!r}") from None
+
+
+def _env_float(env: Mapping[str, str], name: str, default: float) -> float:
+    raw = env.get(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        raise ConfigError(f"Invalid number for {name}: {raw!r}") from None
+
+
+def _env_bool(env: Mapping[str, str], name: str, default: bool) -> bool:
+    raw = env.get(name)
+    if raw is None:
+        return default
+    value = raw.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ConfigError(f"Invalid boolean for {name}: {raw!r} (expected true/false)")
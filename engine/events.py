@@ -3,10 +3,31 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import logging
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Any, Callable, Iterable, Literal, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — fall back to the stdlib encoder.
+    orjson = None
+
+logger = logging.getLogger("agentswarm.events")
+
+OverflowPolicy = Literal["drop_new", "drop_old", "keep_latest"]
+
+# A subscriber that reads this many events without dropping any is considered
+# caught up again, re-arming the "falling behind" warning.
+DROP_WARNING_RESET_READS = 100
+
+
+class EventBusClosed(Exception):
+    """Raised by Subscription.get() once the bus is closed and fully drained."""
 
 
 class EventType(str, Enum):
@@ -25,7 +46,7 @@ class EventType(str, Enum):
     ENGINE_DONE = "engine_done"
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineEvent:
     type: EventType
     task_id: Optional[str] = None
@@ -36,39 +57,200 @@ class EngineEvent:
     data: dict = field(default_factory=dict)
     timestamp: float = field(default_factory=time.time)
 
-    def to_dict(self) -> dict:
-        return {
-            "type": self.type.value,
-            "task_id": self.task_id,
-            "parent_id": self.parent_id,
-            "team": self.team,
-            "description": self.description,
-            "status": self.status,
-            "data": self.data,
-            "timestamp": self.timestamp,
-        }
+
+def encode_event(event: EngineEvent) -> str:
+    """Serialize an event to its JSON wire format."""
+    if orjson is not None:
+        return orjson.dumps(event).decode()
+    return json.dumps(asdict(event))
+
+
+class Subscription:
+    """A subscriber's read cursor into the EventBus log.
+
+    When the subscriber lags more than ``maxsize`` events behind, the overflow
+    policy decides what it misses:
+
+    - ``drop_old``: skip the oldest unread events, keep the newest ``maxsize``.
+    - ``drop_new``: read the next ``maxsize`` events, then skip to the head.
+    - ``keep_latest``: only ever deliver the newest event.
+
+    Events evicted from the shared log are skipped regardless of policy.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        policy: OverflowPolicy = "drop_old",
+        maxsize: int = 1000,
+    ) -> None:
+        self._bus = bus
+        self.policy = policy
+        self.maxsize = 1 if policy == "keep_latest" else maxsize
+        self._cursor = bus._seq  # seq of the last event delivered
+        self._skip_after: int | None = None  # drop_new: jump once cursor reaches this
+        self._skip_to = 0
+        self.dropped = 0
+        self._dropping = False
+        self._clean_reads = 0
+
+    def get_nowait(self) -> Optional[EngineEvent]:
+        """Return the next unseen event, or None if caught up."""
+        log = self._bus._log
+        if not log or self._cursor >= log[-1][0]:
+            return None
+        first_seq, last_seq = log[0][0], log[-1][0]
+
+        start = self._cursor
+        if self._skip_after is not None and self._cursor >= self._skip_after:
+            self._cursor = max(self._cursor, self._skip_to)
+            self._skip_after = None
+        if last_seq - self._cursor > self.maxsize:
+            if self.policy == "drop_new":
+                if self._skip_after is None:
+                    self._skip_after = self._cursor + self.maxsize
+                    self._skip_to = last_seq
+            else:
+                self._cursor = last_seq - self.maxsize
+        # Skip over events evicted from the log before we read them.
+        self._cursor = max(self._cursor, first_seq - 1)
+        self._record_drops(self._cursor - start)
+
+        if self._cursor >= last_seq:
+            return None
+        seq, event = log[self._cursor + 1 - first_seq]
+        self._cursor = seq
+        return event
+
+    def _record_drops(self, count: int) -> None:
+        if count <= 0:
+            self._clean_reads += 1
+            if self._clean_reads >= DROP_WARNING_RESET_READS:
+                self._dropping = False
+            return
+        self.dropped += count
+        self._clean_reads = 0
+        if not self._dropping:
+            self._dropping = True
+            logger.warning(
+                "Event subscriber is falling behind — dropped %d events (policy=%s)",
+                count,
+                self.policy,
+            )
+
+    async def get(self) -> EngineEvent:
+        """Wait for and return the next unseen event.
+
+        Raises EventBusClosed once the bus is closed and every event emitted
+        before that has been delivered.
+        """
+        while True:
+            event = self.get_nowait()
+            if event is not None:
+                return event
+            if self._bus.closed:
+                raise EventBusClosed
+            await self._bus._new_event.wait()
+
+    def __aiter__(self) -> Subscription:
+        return self
+
+    async def __anext__(self) -> EngineEvent:
+        try:
+            return await self.get()
+        except EventBusClosed:
+            raise StopAsyncIteration from None
 
 
 class EventBus:
-    """Simple async event bus for broadcasting engine events to WebSocket subscribers."""
+    """Simple async event bus for broadcasting engine events to WebSocket subscribers.
 
-    def __init__(self) -> None:
-        self._subscribers: list[asyncio.Queue] = []
+    Events are appended once to a bounded shared log; each subscriber pulls
+    from it with its own cursor, so emit() is O(1) regardless of how many
+    subscribers there are and never waits on a slow one. close() marks the end
+    of the stream so subscribers stop waiting as soon as they've drained it.
+    """
+
+    def __init__(self, history: int = 10_000) -> None:
+        self._log: deque[tuple[int, EngineEvent]] = deque(maxlen=history)
+        self._seq = 0
+        self._new_event = asyncio.Event()
+        self._subscribers: list[Subscription] = []
+        self._closed = False
+        # The loop that owns the log and the thread running it; bound at
+        # construction or first subscribe.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        try:
+            self._bind(asyncio.get_running_loop())
+        except RuntimeError:
+            pass
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
 
     def emit(self, event: EngineEvent) -> None:
-        for q in self._subscribers:
-            try:
-                q.put_nowait(event)
-            except asyncio.QueueFull:
-                pass  # Drop events if subscriber is slow.
-
-    def subscribe(self) -> asyncio.Queue[EngineEvent]:
-        q: asyncio.Queue[EngineEvent] = asyncio.Queue(maxsize=1000)
-        self._subscribers.append(q)
-        return q
-
-    def unsubscribe(self, q: asyncio.Queue) -> None:
+        """Publish an event. Safe to call from threads other than the bus's loop."""
+        self._call_in_loop(self._publish, event)
+
+    def emit_many(self, events: Iterable[EngineEvent]) -> None:
+        """Publish several events in order, waking subscribers only once."""
+        batch = list(events)
+        if batch:
+            self._call_in_loop(self._publish_many, batch)
+
+    def _call_in_loop(self, fn: Callable[[Any], None], arg: Any) -> None:
+        if self._loop is not None and threading.get_ident() != self._loop_thread:
+            self._loop.call_soon_threadsafe(fn, arg)
+        else:
+            fn(arg)
+
+    def _publish(self, event: EngineEvent) -> None:
+        self._seq += 1
+        self._log.append((self._seq, event))
+        self._wake()
+
+    def _publish_many(self, events: list[EngineEvent]) -> None:
+        for event in events:
+            self._seq += 1
+            self._log.append((self._seq, event))
+        self._wake()
+
+    def _wake(self) -> None:
+        # Wake everyone waiting on the current generation, then start a new one.
+        waiters, self._new_event = self._new_event, asyncio.Event()
+        waiters.set()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """End the stream; waiting subscribers raise EventBusClosed once drained."""
+        if self._loop is None or threading.get_ident() == self._loop_thread:
+            self._mark_closed()
+        else:
+            # Queued behind this thread's earlier emits, so they are published first.
+            self._loop.call_soon_threadsafe(self._mark_closed)
+
+    def _mark_closed(self) -> None:
+        self._closed = True
+        self._wake()
+
+    def subscribe(
+        self,
+        policy: OverflowPolicy = "drop_old",
+        maxsize: int = 1000,
+    ) -> Subscription:
+        if self._loop is None:
+            self._bind(asyncio.get_running_loop())
+        sub = Subscription(self, policy, maxsize)
+        self._subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
         try:
-            self._subscribers.remove(q)
+            self._subscribers.remove(sub)
         except ValueError:
             pass
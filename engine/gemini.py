@@ -2,15 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import json
 import logging
+import random
 import time
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # Optional speedup — fall back to the stdlib encoder.
+    orjson = None
+
 logger = logging.getLogger("agentswarm.gemini")
 
+# HTTP/2 lets parallel calls share one connection, but needs the h2 package.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+
 
 @dataclass
 class LLMMessage:
@@ -39,6 +62,11 @@ class GeminiClient:
         max_tokens: int,
         temperature: float,
         timeout_s: float = 300.0,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+        max_concurrency: int = 20,
     ) -> None:
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
@@ -46,9 +74,29 @@ class GeminiClient:
         self.max_tokens = max_tokens
         self.temperature = temperature
 
+        # Retry policy for 429s and transport failures (exponential + jitter).
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+        # Caps in-flight requests across all callers sharing this client, so
+        # bursty fan-out doesn't trip provider rate limits.
+        self._sem = asyncio.Semaphore(max_concurrency)
+
+        # Auth never changes, so let httpx merge these into every request.
         self._client = httpx.AsyncClient(
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            },
             timeout=httpx.Timeout(timeout_s, connect=30.0),
-            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=75.0,
+            ),
+            http2=_HTTP2_AVAILABLE,
         )
 
         self.total_requests = 0
@@ -62,46 +110,93 @@ class GeminiClient:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
     ) -> LLMResponse:
-        """Send a chat completion request and return the parsed response."""
+        """Send a chat completion request and return the parsed response.
+
+        Rate limits (429) and transport errors are retried with exponential
+        backoff and jitter; other API errors are raised immediately.
+        """
         url = f"{self.endpoint}/chat/completions"
-        start_ms = time.time() * 1000
         self.total_requests += 1
 
-        payload = {
+        params: dict[str, Any] = {
             "model": model or self.model,
-            "messages": [{"role": m.role, "content": m.content} for m in messages],
             "temperature": temperature if temperature is not None else self.temperature,
             "max_tokens": max_tokens or self.max_tokens,
         }
 
-        logger.debug(
-            "LLM request → %s (model=%s, msgs=%d, chars=%d)",
-            url,
-            payload["model"],
-            len(messages),
-            sum(len(m.content) for m in messages),
-        )
-
-        resp = await self._client.post(
-            url,
-            json=payload,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "LLM request → %s (model=%s, msgs=%d, chars=%d)",
+                url,
+                params["model"],
+                len(messages),
+                sum(len(m.content) for m in messages),
+            )
 
-        if resp.status_code == 429:
-            # Rate limited — let caller handle retry/backoff.
-            raise RateLimitError(f"Gemini rate limit (429): {resp.text[:500]}")
+        # Encode once; retries re-post the same bytes. The messages array is
+        # spliced in from per-message fragments so large constant system
+        # prompts are serialized once, not on every call.
+        body = b"".join((
+            self._encode(params)[:-1],
+            b',"messages":[',
+            b",".join(_encode_message(m) for m in messages),
+            b"]}",
+        ))
+        return await self._complete_with_retry(url, body)
+
+    async def _complete_with_retry(self, url: str, body: bytes) -> LLMResponse:
+        attempt = 0
+        while True:
+            try:
+                async with self._sem:
+                    return await self._post(url, body)
+            except (RateLimitError, httpx.TransportError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt, getattr(e, "retry_after", None))
+                logger.warning(
+                    "Gemini request failed (%s) — retry %d/%d in %.1fs",
+                    e,
+                    attempt + 1,
+                    self.max_retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay * (1 + random.random() * self.jitter)
+
+    @staticmethod
+    def _encode(payload: dict) -> bytes:
+        return _dumps(payload)
+
+    async def _post(self, url: str, body: bytes) -> LLMResponse:
+        start_ns = time.monotonic_ns()
+
+        resp = await self._client.post(url, content=body)
 
         if resp.status_code != 200:
-            raise APIError(
-                f"Gemini API error ({resp.status_code}): {resp.text[:1000]}"
-            )
-
-        raw = resp.json()
-        latency_ms = int(time.time() * 1000 - start_ms)
+            # Only a snippet is needed; decoding a slice skips charset detection
+            # of the whole (possibly huge) error page.
+            err_snippet = resp.content[:1000].decode("utf-8", errors="replace")
+            if resp.status_code == 429:
+                raise RateLimitError(
+                    f"Gemini rate limit (429): {err_snippet[:500]}",
+                    retry_after=_parse_retry_after(resp.headers.get("retry-after")),
+                )
+            raise APIError(f"Gemini API error ({resp.status_code}): {err_snippet}")
+
+        # Decode the raw bytes directly; resp.json() would go through the stdlib
+        # decoder after a separate text decode.
+        try:
+            raw = _loads(resp.content)
+        except ValueError as e:
+            raise APIError(f"Invalid JSON in Gemini response: {e}") from e
+        latency_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
         # Gemini sometimes wraps the response in a JSON array.
         data = raw[0] if isinstance(raw, list) else raw
@@ -127,13 +222,14 @@ class GeminiClient:
         if not content:
             raise APIError(f"Empty content in Gemini response: {str(data)[:500]}")
 
-        logger.debug(
-            "LLM response ← %d chars, %d tokens, %dms, finish=%s",
-            len(content),
-            total,
-            latency_ms,
-            choice.get("finish_reason", "?"),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "LLM response ← %d chars, %d tokens, %dms, finish=%s",
+                len(content),
+                total,
+                latency_ms,
+                choice.get("finish_reason", "?"),
+            )
 
         return LLMResponse(
             content=content,
@@ -148,9 +244,36 @@ class GeminiClient:
         await self._client.aclose()
 
 
+def _encode_message(message: LLMMessage) -> bytes:
+    if message.role == "system":
+        return _encode_system_message(message.content)
+    return _dumps({"role": message.role, "content": message.content})
+
+
+@lru_cache(maxsize=32)
+def _encode_system_message(content: str) -> bytes:
+    # System prompts are a handful of constant strings reused across every
+    # worker and fix call; str caches its hash, so lookups stay cheap.
+    return _dumps({"role": "system", "content": content})
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP-date form is ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
 class RateLimitError(Exception):
     """Raised when the API returns 429."""
 
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class APIError(Exception):
     """Raised on non-200/non-429 API responses."""
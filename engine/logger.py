@@ -5,15 +5,38 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from datetime import datetime, timezone
+import time
+
+try:
+    import orjson
+except ImportError:  # Optional speedup — fall back to the stdlib encoder.
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj: object) -> str:
+        return orjson.dumps(obj, default=str).decode()
+else:
+    def _dumps(obj: object) -> str:
+        return json.dumps(obj, default=str)
 
 
 class NdjsonFormatter(logging.Formatter):
     """Emit one JSON object per log line."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        # The seconds part of the timestamp only changes once per second.
+        self._last_sec = -1
+        self._last_ts = ""
+
     def format(self, record: logging.LogRecord) -> str:
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_ts = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        millis = int((record.created - sec) * 1000)
         entry: dict = {
-            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "ts": f"{self._last_ts}.{millis:03d}+00:00",
             "level": record.levelname.lower(),
             "logger": record.name,
             "msg": record.getMessage(),
@@ -22,7 +45,7 @@ class NdjsonFormatter(logging.Formatter):
         data = getattr(record, "data", None)
         if data:
             entry["data"] = data
-        return json.dumps(entry, default=str)
+        return _dumps(entry)
 
 
 class HumanFormatter(logging.Formatter):
@@ -37,16 +60,31 @@ class HumanFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._last_sec = -1
+        self._last_ts = ""
+        # levelno → (color, " [L] ") so format() does a single int-keyed lookup.
+        self._level_parts = {
+            logging.getLevelNamesMapping()[name]: (color, f" [{name[0]}] ")
+            for name, color in self.COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, "")
-        ts = datetime.now().strftime("%H:%M:%S")
+        parts = self._level_parts.get(record.levelno)
+        if parts is None:
+            parts = ("", f" [{record.levelname[0]}] ")
+        color, level_tag = parts
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_ts = time.strftime("%H:%M:%S", time.localtime(sec))
+        ts = self._last_ts
         name = record.name.replace("agentswarm.", "")
         msg = record.getMessage()
         data = getattr(record, "data", None)
-        suffix = ""
-        if data:
-            suffix = f"  {json.dumps(data, default=str)}"
-        return f"{color}{ts} [{record.levelname[0]}] {name}: {msg}{suffix}{self.RESET}"
+        suffix = f"  {_dumps(data)}" if data else ""
+        return f"{color}{ts}{level_tag}{name}: {msg}{suffix}{self.RESET}"
 
 
 def setup_logging(level: str = "info", log_file: str | None = None) -> None:
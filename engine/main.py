@@ -9,20 +9,29 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import functools
+import hashlib
+import json
 import shutil
 import subprocess
 import sys
 import time
+import weakref
 import webbrowser
 from pathlib import Path
 
-from .config import load_config
+from .config import Config, LLMConfig, load_config
 from .events import EngineEvent, EventBus, EventType
 from .gemini import GeminiClient, LLMMessage
 from .logger import get_logger, setup_logging
 from .parsing import parse_worker_response
 from .planner import Planner
-from .project_state import read_project_state, read_file_contents
+from .project_state import (
+    mark_dirty,
+    read_file_contents,
+    read_file_contents_async,
+    read_project_state,
+)
 from .reconciler import Reconciler
 from .subplanner import Subplanner
 from .worker import WorkerPool
@@ -31,6 +40,125 @@ logger = get_logger("main")
 
 MAX_VALIDATION_ROUNDS = 3
 VALIDATION_TIMEOUT_S = 30
+PIP_TIMEOUT_S = 120
+
+# Lives next to (not inside) the output dir so it survives the per-run wipe.
+CACHE_DIR_NAME = ".agentswarm_cache"
+
+# Ideas longer than this (or multi-line) are treated as specs already.
+_DETAILED_IDEA_CHARS = 400
+
+
+# Constant system prompts for the one-shot spec / launch-script calls. They
+# always lead the request, so Gemini's implicit prefix caching can reuse them.
+_LAUNCH_SYSTEM = (
+    "You are a devops helper. You write Windows batch files. "
+    "Respond with ONLY the raw batch file content. No markdown fences. No explanation."
+)
+
+_FLESH_OUT_SYSTEM = (
+    "You are a product designer. The user gives you a short project idea. "
+    "Expand it into a clear, detailed specification in 1-2 paragraphs. "
+    "Include: what the project is, key features, the main user interactions, and what the end result looks like. "
+    "Be specific about colors, layout, and behavior. "
+    "\n\n"
+    "CRITICAL — Technology choices:\n"
+    "- If the user specifies a technology (tkinter, pygame, flask, HTML, etc.), you MUST use that exact technology. Do NOT substitute.\n"
+    "- If the user says 'tkinter', use tkinter. Do NOT change it to pygame.\n"
+    "- If the user says 'pygame', use pygame.\n"
+    "- If the user says 'HTML' or 'web', use HTML/JS/CSS.\n"
+    "- Only if NO technology is mentioned, suggest one: Python+pygame for games, HTML/JS/CSS for visual demos, Python+tkinter for desktop apps.\n"
+    "\n"
+    "IMPORTANT: All graphics must be drawn programmatically (shapes, code-defined colors). "
+    "NEVER mention external asset files (no .png, .ttf, .wav). "
+    "Respond with ONLY the expanded specification. No preamble."
+)
+
+_CONVERSATION_SPEC_SYSTEM = (
+    "You are a product designer. You have a conversation transcript between a user and an AI "
+    "assistant where the user described their startup or project idea in detail.\n\n"
+    "Your job is to extract ALL important details from this conversation and produce a clear, "
+    "detailed project specification that a development team can build from immediately.\n\n"
+    "Include:\n"
+    "- What the project is and its purpose\n"
+    "- Key features and functionality\n"
+    "- User interactions and flows\n"
+    "- Technical requirements and constraints\n"
+    "- Visual design details (colors, layout, behavior)\n"
+    "- What the end result should look and feel like\n\n"
+    "CRITICAL — Technology choices:\n"
+    "- If the user specified a technology (tkinter, pygame, flask, HTML, etc.), use that EXACT technology.\n"
+    "- If no technology is mentioned, suggest: Python+pygame for games, HTML/JS/CSS for visual demos, "
+    "Python+tkinter for desktop apps.\n\n"
+    "IMPORTANT: All graphics must be drawn programmatically (shapes, code-defined colors). "
+    "NEVER mention external asset files (no .png, .ttf, .wav). "
+    "Respond with ONLY the expanded specification. No preamble."
+)
+
+
+# Reused across runs (e.g. successive builds in the server) so the HTTP
+# connection pool and its TLS sessions survive between them. Rebuilt if the
+# event loop or LLM settings change, since the client is bound to both; the
+# loop is only weakly referenced so a finished one can be collected.
+_shared_client: GeminiClient | None = None
+_shared_client_loop: weakref.ReferenceType[asyncio.AbstractEventLoop] | None = None
+_shared_client_llm: LLMConfig | None = None
+# Close tasks for replaced clients, kept referenced until they finish.
+_closing_clients: set[asyncio.Task] = set()
+
+
+def _get_client(config: Config) -> GeminiClient:
+    """Return the process-wide GeminiClient for the running loop and config."""
+    global _shared_client, _shared_client_loop, _shared_client_llm
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_client is not None
+        and _shared_client_loop is not None
+        and _shared_client_loop() is loop
+        and _shared_client_llm == config.llm
+    ):
+        return _shared_client
+
+    old = _shared_client
+    _shared_client = GeminiClient(
+        endpoint=config.llm.endpoint,
+        api_key=config.llm.api_key,
+        model=config.llm.model,
+        max_tokens=config.llm.max_tokens,
+        temperature=config.llm.temperature,
+        timeout_s=config.llm.timeout_s,
+    )
+    _shared_client_loop = weakref.ref(loop)
+    _shared_client_llm = config.llm
+    if old is not None:
+        # Release the replaced client's connection pool.
+        task = loop.create_task(_close_replaced_client(old))
+        _closing_clients.add(task)
+        task.add_done_callback(_closing_clients.discard)
+    return _shared_client
+
+
+async def _close_replaced_client(client: GeminiClient) -> None:
+    try:
+        await client.close()
+    except Exception as e:
+        # Its connections may belong to a loop that has already closed.
+        logger.warning("Could not close replaced GeminiClient: %s", e)
+
+
+async def close_shared_client() -> None:
+    """Close the shared GeminiClient, if any. Call before the event loop exits."""
+    global _shared_client, _shared_client_loop, _shared_client_llm
+    if _shared_client is not None:
+        client, _shared_client = _shared_client, None
+        _shared_client_loop = _shared_client_llm = None
+        await client.close()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_prompt(path: Path) -> str:
+    """Read a bundled prompt file once per process."""
+    return path.read_text(encoding="utf-8")
 
 
 async def run(request: str) -> None:
@@ -43,28 +171,18 @@ async def run(request: str) -> None:
     logger.info("Max workers: %d", config.max_workers)
     logger.info("Output dir: %s", config.output_dir.resolve())
 
-    # Clean output directory from previous runs.
-    if config.output_dir.exists():
-        shutil.rmtree(config.output_dir)
-        logger.info("Cleared previous output directory")
-
-    # Ensure output directory exists.
-    config.output_dir.mkdir(parents=True, exist_ok=True)
-
     # Build components.
-    client = GeminiClient(
-        endpoint=config.llm.endpoint,
-        api_key=config.llm.api_key,
-        model=config.llm.model,
-        max_tokens=config.llm.max_tokens,
-        temperature=config.llm.temperature,
-        timeout_s=config.llm.timeout_s,
-    )
+    client = _get_client(config)
+    requests_before, tokens_before = client.total_requests, client.total_tokens_used
 
-    # Flesh out vague ideas into detailed specs.
+    # Flesh out vague ideas into detailed specs while the previous run's
+    # output is cleared (the spec cache lives outside the output dir).
     print()
     print("  Expanding idea...")
-    request = await _flesh_out_idea(client, request)
+    request, _ = await asyncio.gather(
+        _flesh_out_idea(client, request, _spec_cache_dir(config)),
+        _reset_output_dir(config.output_dir),
+    )
     print(f"  Specification:\n  {request[:300]}{'...' if len(request) > 300 else ''}")
     print()
     logger.info("Expanded request: %s", request[:500])
@@ -74,8 +192,8 @@ async def run(request: str) -> None:
     worker_pool = WorkerPool(client, config.output_dir, prompts_dir, config.max_workers)
     worker_pool.load_prompts()
 
-    root_prompt = (prompts_dir / "root-planner.md").read_text(encoding="utf-8")
-    subplanner_prompt = (prompts_dir / "subplanner.md").read_text(encoding="utf-8")
+    root_prompt = _load_prompt(prompts_dir / "root-planner.md")
+    subplanner_prompt = _load_prompt(prompts_dir / "subplanner.md")
 
     subplanner = Subplanner(config, client, worker_pool, subplanner_prompt)
     planner = Planner(config, client, worker_pool, root_prompt, subplanner)
@@ -86,7 +204,7 @@ async def run(request: str) -> None:
     if config.reconciler_enabled:
         reconciler_prompt_path = prompts_dir / "reconciler.md"
         if reconciler_prompt_path.exists():
-            reconciler_prompt = reconciler_prompt_path.read_text(encoding="utf-8")
+            reconciler_prompt = _load_prompt(reconciler_prompt_path)
             reconciler = Reconciler(
                 config, client, reconciler_prompt, config.output_dir
             )
@@ -120,15 +238,15 @@ async def run(request: str) -> None:
     print(f"  One Call — Build Complete")
     print(f"  Time:     {elapsed_build:.1f}s")
     print(f"  Tasks:    {total_tasks} dispatched, {completed} completed")
-    print(f"  Tokens:   {client.total_tokens_used:,}")
-    print(f"  API calls: {client.total_requests}")
+    print(f"  Tokens:   {client.total_tokens_used - tokens_before:,}")
+    print(f"  API calls: {client.total_requests - requests_before}")
     print(f"  Output:   {config.output_dir.resolve().as_uri()}")
     print("=" * 60)
 
     # --- Generate launch script ---
     print()
     print("  Generating launch script...")
-    await _generate_launch_script(client, config.output_dir)
+    await _generate_launch_script(client, config.output_dir, _spec_cache_dir(config))
 
     # --- Post-build validation ---
     print()
@@ -145,36 +263,112 @@ async def run(request: str) -> None:
     logger.info("Opening output directory in browser: %s", config.output_dir.resolve().as_uri())
     webbrowser.open(config.output_dir.resolve().as_uri())
 
-    await client.close()
-
     total_elapsed = time.time() - start_time
     print()
     print("=" * 60)
     print(f"  One Call — All Done")
     print(f"  Total time: {total_elapsed:.1f}s")
-    print(f"  Total tokens: {client.total_tokens_used:,}")
-    print(f"  Total API calls: {client.total_requests}")
+    print(f"  Total tokens: {client.total_tokens_used - tokens_before:,}")
+    print(f"  Total API calls: {client.total_requests - requests_before}")
     print("=" * 60)
 
 
-async def _generate_launch_script(client: GeminiClient, output_dir: Path) -> None:
+async def _reset_output_dir(output_dir: Path) -> None:
+    """Clear the output directory from previous runs and recreate it."""
+    if output_dir.exists():
+        await asyncio.to_thread(shutil.rmtree, output_dir, ignore_errors=True)
+        logger.info("Cleared previous output directory")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    mark_dirty(output_dir)
+
+
+def _spec_cache_dir(config: Config) -> Path | None:
+    """Where spec/launch responses are cached, or None if SPEC_CACHE_ENABLED is off."""
+    if not config.spec_cache_enabled:
+        return None
+    return config.output_dir.parent / CACHE_DIR_NAME / "specs"
+
+
+async def _cached_complete(
+    client: GeminiClient,
+    messages: list[LLMMessage],
+    tag: str,
+    cache_dir: Path | None,
+) -> str:
+    """client.complete() with a write-through on-disk cache of the response text.
+
+    Keyed by a hash of the model, temperature and messages, so re-running with
+    an identical prompt skips the Gemini round trip. Bypassed when the client
+    samples (temperature > 0): replaying one sample would pin every later run
+    to it.
+    """
+    if cache_dir is None or client.temperature > 0:
+        return (await client.complete(messages)).content
+
+    key_src = json.dumps(
+        {
+            "model": client.model,
+            "temperature": client.temperature,
+            "messages": [[m.role, m.content] for m in messages],
+        },
+        sort_keys=True,
+    )
+    key = hashlib.sha256(key_src.encode("utf-8")).hexdigest()
+    path = cache_dir / f"{tag}-{key}.json"
+
+    try:
+        content = json.loads(path.read_text(encoding="utf-8"))["content"]
+        logger.info("Using cached %s response (%s)", tag, path.name)
+        return content
+    except (OSError, ValueError, KeyError):
+        pass
+
+    response = await client.complete(messages)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"content": response.content}), encoding="utf-8")
+    except OSError as e:
+        logger.warning("Could not write %s cache entry: %s", tag, e)
+    return response.content
+
+
+def _format_file_blocks(contents: dict[str, str]) -> str:
+    """Render path → content as fenced markdown blocks for a prompt."""
+    return "".join(
+        f"\n### {path}\n```\n{content}\n```\n" for path, content in contents.items()
+    )
+
+
+# Files _generate_launch_script() sends in full; other root files are cut to a head.
+_LAUNCH_FULL_FILES = frozenset({
+    "main.py", "app.py", "run.py", "requirements.txt", "index.html", "README.md",
+})
+_LAUNCH_HEAD_CHARS = 1024
+
+
+async def _generate_launch_script(
+    client: GeminiClient, output_dir: Path, cache_dir: Path | None = None
+) -> None:
     """Ask Gemini to write a launch.bat that runs the project with zero intervention."""
     state = read_project_state(output_dir)
-    all_contents = read_file_contents(output_dir, state.file_tree)
+
+    # Only what decides how the project starts is sent in full; other root
+    # files get a short head and nested files appear in the tree only.
+    full_paths = [
+        p for p in state.file_tree
+        if p in _LAUNCH_FULL_FILES or p.rsplit("/", 1)[-1] == "__main__.py"
+    ]
+    head_paths = [p for p in state.file_tree if "/" not in p and p not in _LAUNCH_FULL_FILES]
+    full, heads = await asyncio.gather(
+        read_file_contents_async(output_dir, full_paths),
+        read_file_contents_async(output_dir, head_paths, max_chars=_LAUNCH_HEAD_CHARS),
+    )
 
     file_tree_str = "\n".join(state.file_tree) if state.file_tree else "(empty)"
-    contents_str = ""
-    for path, content in all_contents.items():
-        contents_str += f"\n### {path}\n```\n{content}\n```\n"
+    contents_str = _format_file_blocks({**full, **heads})
 
     messages = [
-        LLMMessage(
-            role="system",
-            content=(
-                "You are a devops helper. You write Windows batch files. "
-                "Respond with ONLY the raw batch file content. No markdown fences. No explanation."
-            ),
-        ),
+        LLMMessage(role="system", content=_LAUNCH_SYSTEM),
         LLMMessage(
             role="user",
             content=f"""Write a Windows batch file called launch.bat that launches this project with ZERO human intervention.
@@ -200,8 +394,9 @@ Rules:
     ]
 
     try:
-        response = await client.complete(messages)
-        bat_content = response.content.strip()
+        bat_content = (
+            await _cached_complete(client, messages, "launch", cache_dir)
+        ).strip()
 
         # Strip markdown fences if Gemini wrapped it anyway.
         if bat_content.startswith("```"):
@@ -220,35 +415,21 @@ Rules:
         print(f"  WARNING: Could not generate launch.bat: {e}")
 
 
-async def _flesh_out_idea(client: GeminiClient, raw_idea: str) -> str:
+async def _flesh_out_idea(
+    client: GeminiClient, raw_idea: str, cache_dir: Path | None = None
+) -> str:
     """Take a vague user idea and expand it into a detailed project specification."""
+    if len(raw_idea) > _DETAILED_IDEA_CHARS or raw_idea.count("\n") >= 3:
+        logger.info("Skipping idea expansion — already detailed (%d chars)", len(raw_idea))
+        return raw_idea
+
     messages = [
-        LLMMessage(
-            role="system",
-            content=(
-                "You are a product designer. The user gives you a short project idea. "
-                "Expand it into a clear, detailed specification in 1-2 paragraphs. "
-                "Include: what the project is, key features, the main user interactions, and what the end result looks like. "
-                "Be specific about colors, layout, and behavior. "
-                "\n\n"
-                "CRITICAL — Technology choices:\n"
-                "- If the user specifies a technology (tkinter, pygame, flask, HTML, etc.), you MUST use that exact technology. Do NOT substitute.\n"
-                "- If the user says 'tkinter', use tkinter. Do NOT change it to pygame.\n"
-                "- If the user says 'pygame', use pygame.\n"
-                "- If the user says 'HTML' or 'web', use HTML/JS/CSS.\n"
-                "- Only if NO technology is mentioned, suggest one: Python+pygame for games, HTML/JS/CSS for visual demos, Python+tkinter for desktop apps.\n"
-                "\n"
-                "IMPORTANT: All graphics must be drawn programmatically (shapes, code-defined colors). "
-                "NEVER mention external asset files (no .png, .ttf, .wav). "
-                "Respond with ONLY the expanded specification. No preamble."
-            ),
-        ),
+        LLMMessage(role="system", content=_FLESH_OUT_SYSTEM),
         LLMMessage(role="user", content=raw_idea),
     ]
 
     try:
-        response = await client.complete(messages)
-        expanded = response.content.strip()
+        expanded = (await _cached_complete(client, messages, "idea", cache_dir)).strip()
         if len(expanded) > len(raw_idea) * 1.5 and len(expanded) > 100:
             return expanded
         return raw_idea
@@ -258,62 +439,121 @@ async def _flesh_out_idea(client: GeminiClient, raw_idea: str) -> str:
 
 
 async def _install_dependencies(output_dir: Path) -> None:
-    """Install dependencies from requirements.txt if it exists."""
+    """Install dependencies from requirements.txt if it exists.
+
+    Skips pip entirely when requirements.txt hashes the same as the last
+    successful install into this interpreter. The hash is kept next to the
+    output dir, since the output dir itself is wiped at the start of each run.
+    """
     req_file = output_dir / "requirements.txt"
     if not req_file.exists():
         logger.info("No requirements.txt found — skipping dependency install")
         return
 
+    hash_file = output_dir.parent / CACHE_DIR_NAME / "last_reqs.sha256"
+    req_hash = _requirements_hash(req_file)
+    try:
+        if hash_file.read_text(encoding="utf-8").strip() == req_hash:
+            logger.info("requirements.txt unchanged — deps unchanged, skipping pip")
+            return
+    except OSError:
+        pass
+
     logger.info("Installing dependencies from requirements.txt")
     print("  Installing dependencies...")
 
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "install", "-r", str(req_file), "-q"],
-            capture_output=True,
-            text=True,
-            timeout=120,
-            cwd=str(output_dir),
-        )
-        if result.returncode == 0:
+        returncode, stderr = await _pip_install(req_file, output_dir)
+        if returncode != 0 and "pygame" in stderr.lower():
+            # Try pygame-ce fallback if pygame fails.
+            print(f"  pip install failed (exit {returncode})")
+            logger.info("pygame install failed — trying pygame-ce")
+            print("  Retrying with pygame-ce...")
+            # Replace pygame with pygame-ce in requirements.
+            req_text = req_file.read_text(encoding="utf-8")
+            req_text = req_text.replace("pygame", "pygame-ce")
+            req_file.write_text(req_text, encoding="utf-8")
+            req_hash = _requirements_hash(req_file)
+            returncode, stderr = await _pip_install(req_file, output_dir)
+            if returncode == 0:
+                print("  Dependencies installed with pygame-ce.")
+            else:
+                print(f"  pygame-ce also failed: {stderr[:200]}")
+        elif returncode == 0:
             print("  Dependencies installed successfully.")
             logger.info("pip install succeeded")
         else:
-            print(f"  pip install failed (exit {result.returncode})")
-            if result.stderr:
-                # Try pygame-ce fallback if pygame fails.
-                if "pygame" in result.stderr.lower():
-                    logger.info("pygame install failed — trying pygame-ce")
-                    print("  Retrying with pygame-ce...")
-                    # Replace pygame with pygame-ce in requirements.
-                    req_text = req_file.read_text(encoding="utf-8")
-                    req_text = req_text.replace("pygame", "pygame-ce")
-                    req_file.write_text(req_text, encoding="utf-8")
-                    result2 = subprocess.run(
-                        [
-                            sys.executable,
-                            "-m",
-                            "pip",
-                            "install",
-                            "-r",
-                            str(req_file),
-                            "-q",
-                        ],
-                        capture_output=True,
-                        text=True,
-                        timeout=120,
-                        cwd=str(output_dir),
-                    )
-                    if result2.returncode == 0:
-                        print("  Dependencies installed with pygame-ce.")
-                    else:
-                        print(f"  pygame-ce also failed: {result2.stderr[:200]}")
-                else:
-                    print(f"  Error: {result.stderr[:300]}")
-    except subprocess.TimeoutExpired:
-        print("  pip install timed out after 120s")
+            print(f"  pip install failed (exit {returncode})")
+            if stderr:
+                print(f"  Error: {stderr[:300]}")
+    except asyncio.TimeoutError:
+        print(f"  pip install timed out after {PIP_TIMEOUT_S}s")
+        return
     except Exception as e:
         print(f"  pip install error: {e}")
+        return
+
+    if returncode == 0:
+        try:
+            hash_file.parent.mkdir(parents=True, exist_ok=True)
+            hash_file.write_text(req_hash, encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not record requirements hash: %s", e)
+
+
+def _requirements_hash(req_file: Path) -> str:
+    # Includes the interpreter: pip installs into whichever one runs it.
+    return hashlib.sha256(
+        sys.executable.encode("utf-8") + b"\0" + req_file.read_bytes()
+    ).hexdigest()
+
+
+async def _pip_install(req_file: Path, output_dir: Path) -> tuple[int, str]:
+    """Returns (returncode, stderr).
+
+    Only stderr is kept (for the pygame fallback check); quiet-mode stdout
+    goes straight to the terminal instead of being buffered.
+    """
+    returncode, _, stderr = await _run_python(
+        [
+            "-m", "pip", "install",
+            "-r", str(req_file),
+            "-q", "--no-input", "--disable-pip-version-check",
+        ],
+        output_dir,
+        PIP_TIMEOUT_S,
+        capture_stdout=False,
+    )
+    return returncode, stderr
+
+
+async def _run_python(
+    args: list[str], cwd: Path, timeout: float, *, capture_stdout: bool = True
+) -> tuple[int, str, str]:
+    """Run the current interpreter with ``args`` without blocking the event loop.
+
+    Returns (returncode, stdout, stderr). With ``capture_stdout=False`` the
+    child writes straight to our stdout and "" is returned in its place. On
+    timeout the process is killed and asyncio.TimeoutError is raised.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        *args,
+        stdout=asyncio.subprocess.PIPE if capture_stdout else None,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=str(cwd),
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return (
+        proc.returncode,
+        stdout.decode("utf-8", errors="replace") if stdout else "",
+        stderr.decode("utf-8", errors="replace"),
+    )
 
 
 async def _validation_loop(
@@ -510,44 +750,23 @@ Key rules:
         return False
 
 
-async def _conversation_to_spec(client: GeminiClient, conversation: list[dict]) -> str:
+async def _conversation_to_spec(
+    client: GeminiClient, conversation: list[dict], cache_dir: Path | None = None
+) -> str:
     """Convert a conversation transcript into a detailed project specification."""
     conv_text = "\n".join(
         f"{msg.get('role', 'unknown')}: {msg.get('text', '')}" for msg in conversation
     )
 
     messages = [
-        LLMMessage(
-            role="system",
-            content=(
-                "You are a product designer. You have a conversation transcript between a user and an AI "
-                "assistant where the user described their startup or project idea in detail.\n\n"
-                "Your job is to extract ALL important details from this conversation and produce a clear, "
-                "detailed project specification that a development team can build from immediately.\n\n"
-                "Include:\n"
-                "- What the project is and its purpose\n"
-                "- Key features and functionality\n"
-                "- User interactions and flows\n"
-                "- Technical requirements and constraints\n"
-                "- Visual design details (colors, layout, behavior)\n"
-                "- What the end result should look and feel like\n\n"
-                "CRITICAL — Technology choices:\n"
-                "- If the user specified a technology (tkinter, pygame, flask, HTML, etc.), use that EXACT technology.\n"
-                "- If no technology is mentioned, suggest: Python+pygame for games, HTML/JS/CSS for visual demos, "
-                "Python+tkinter for desktop apps.\n\n"
-                "IMPORTANT: All graphics must be drawn programmatically (shapes, code-defined colors). "
-                "NEVER mention external asset files (no .png, .ttf, .wav). "
-                "Respond with ONLY the expanded specification. No preamble."
-            ),
-        ),
+        LLMMessage(role="system", content=_CONVERSATION_SPEC_SYSTEM),
         LLMMessage(
             role="user", content=f"Here is the conversation transcript:\n\n{conv_text}"
         ),
     ]
 
     try:
-        response = await client.complete(messages)
-        spec = response.content.strip()
+        spec = (await _cached_complete(client, messages, "spec", cache_dir)).strip()
         if len(spec) > 100:
             return spec
         return conv_text
@@ -568,22 +787,14 @@ async def run_from_conversation(conversation: list[dict], event_bus: EventBus) -
     logger.info("Max workers: %d", config.max_workers)
     logger.info("Output dir: %s", config.output_dir.resolve())
 
-    if config.output_dir.exists():
-        shutil.rmtree(config.output_dir)
-        logger.info("Cleared previous output directory")
-    config.output_dir.mkdir(parents=True, exist_ok=True)
-
-    client = GeminiClient(
-        endpoint=config.llm.endpoint,
-        api_key=config.llm.api_key,
-        model=config.llm.model,
-        max_tokens=config.llm.max_tokens,
-        temperature=config.llm.temperature,
-        timeout_s=config.llm.timeout_s,
-    )
+    client = _get_client(config)
+    requests_before, tokens_before = client.total_requests, client.total_tokens_used
 
     # Convert conversation to spec instead of fleshing out a single idea.
-    request = await _conversation_to_spec(client, conversation)
+    request, _ = await asyncio.gather(
+        _conversation_to_spec(client, conversation, _spec_cache_dir(config)),
+        _reset_output_dir(config.output_dir),
+    )
     event_bus.emit(
         EngineEvent(
             type=EventType.SPEC_CREATED,
@@ -599,8 +810,8 @@ async def run_from_conversation(conversation: list[dict], event_bus: EventBus) -
     )
     worker_pool.load_prompts()
 
-    root_prompt = (prompts_dir / "root-planner.md").read_text(encoding="utf-8")
-    subplanner_prompt = (prompts_dir / "subplanner.md").read_text(encoding="utf-8")
+    root_prompt = _load_prompt(prompts_dir / "root-planner.md")
+    subplanner_prompt = _load_prompt(prompts_dir / "subplanner.md")
 
     subplanner = Subplanner(config, client, worker_pool, subplanner_prompt, event_bus)
     planner = Planner(config, client, worker_pool, root_prompt, subplanner, event_bus)
@@ -610,7 +821,7 @@ async def run_from_conversation(conversation: list[dict], event_bus: EventBus) -
     if config.reconciler_enabled:
         reconciler_prompt_path = prompts_dir / "reconciler.md"
         if reconciler_prompt_path.exists():
-            reconciler_prompt = reconciler_prompt_path.read_text(encoding="utf-8")
+            reconciler_prompt = _load_prompt(reconciler_prompt_path)
             reconciler = Reconciler(
                 config, client, reconciler_prompt, config.output_dir, event_bus
             )
@@ -646,14 +857,14 @@ async def run_from_conversation(conversation: list[dict], event_bus: EventBus) -
                 "time": round(elapsed, 1),
                 "tasks_dispatched": total_tasks,
                 "tasks_completed": completed,
-                "tokens": client.total_tokens_used,
-                "api_calls": client.total_requests,
+                "tokens": client.total_tokens_used - tokens_before,
+                "api_calls": client.total_requests - requests_before,
             },
         )
     )
 
     # Generate launch script.
-    await _generate_launch_script(client, config.output_dir)
+    await _generate_launch_script(client, config.output_dir, _spec_cache_dir(config))
 
     # Post-build validation (skipped)
     await _install_dependencies(config.output_dir)
@@ -661,14 +872,12 @@ async def run_from_conversation(conversation: list[dict], event_bus: EventBus) -
     logger.info("Opening output directory in browser: %s", config.output_dir.resolve().as_uri())
     webbrowser.open(config.output_dir.resolve().as_uri())
 
-    await client.close()
-
     event_bus.emit(
         EngineEvent(
             type=EventType.ENGINE_DONE,
             data={
                 "total_time": round(time.time() - start_time, 1),
-                "total_tokens": client.total_tokens_used,
+                "total_tokens": client.total_tokens_used - tokens_before,
                 "output_dir": config.output_dir.resolve().as_uri(),
             },
         )
@@ -688,7 +897,14 @@ def main() -> None:
             print("No request provided. Exiting.")
             sys.exit(1)
 
-    asyncio.run(run(request))
+    asyncio.run(_run_cli(request))
+
+
+async def _run_cli(request: str) -> None:
+    try:
+        await run(request)
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
@@ -6,13 +6,43 @@ import json
 import logging
 import re
 from dataclasses import dataclass, field
+from typing import Iterator
+from json.decoder import scanstring
 
 from .types import FileOperation, Handoff, HandoffMetrics, WorkerResult
 
+try:
+    import orjson
+except ImportError:  # Optional speedup — fall back to the stdlib decoder.
+    orjson = None
+
 logger = logging.getLogger("agentswarm.parsing")
 
+# Shared decoder: skips json.loads()' per-call argument handling. Still used
+# for raw_decode()/scanstring(), which orjson has no equivalent for.
+_DECODER = json.JSONDecoder()
 
-@dataclass
+# Whole-document decodes go through orjson when available; its errors
+# subclass ValueError, like the stdlib's.
+_loads = orjson.loads if orjson is not None else _DECODER.decode
+
+# A JSON string literal: escape pairs kept whole, runs to end of text if unterminated.
+_STRING_LITERAL_RE = re.compile(r'"(?:[^"\\]+|\\[\s\S])*(?:"|\\?\Z)')
+# String literals plus the structural characters _repair_json() tracks.
+_JSON_TOKEN_RE = re.compile(_STRING_LITERAL_RE.pattern + r'|[{}\[\],]')
+_ARRAY_SEP_RE = re.compile(r"[\s,]*")
+
+# Fence stripping and salvage patterns.
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?([\s\S]*?)```")
+_SCRATCHPAD_RE = re.compile(r'"scratchpad"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_TASKS_ARR_RE = re.compile(r'"tasks"\s*:\s*\[')
+_FILE_OPS_RE = re.compile(r'"file_operations"\s*:\s*\[')
+_FILE_OP_HEAD_RE = re.compile(r'\{\s*"path"\s*:\s*"([^"]+)"\s*,\s*"content"\s*:\s*"')
+_STATUS_RE = re.compile(r'"status"\s*:\s*"([^"]+)"')
+_SUMMARY_RE = re.compile(r'"summary"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+@dataclass(slots=True)
 class RawTaskInput:
     id: str | None = None
     description: str = ""
@@ -33,128 +63,129 @@ class PlannerResponse:
 # ---------------------------------------------------------------------------
 
 def _try_json_loads(text: str) -> dict | list | None:
-    """Try json.loads, return None on failure."""
+    """Try to decode JSON, return None on failure."""
     try:
-        return json.loads(text)
-    except (json.JSONDecodeError, ValueError):
+        return _loads(text)
+    except ValueError:
         return None
 
 
-def _repair_json(text: str) -> str:
-    """Attempt to repair common JSON issues from LLM output.
-
-    The #1 problem: LLMs put literal newlines inside JSON string values
-    (the "content" field with source code). Standard JSON requires \\n instead.
-
-    Strategy: Walk through the JSON character by character. When inside a string,
-    replace literal newlines with \\n, literal tabs with \\t.
-    """
-    # Fast path: already valid.
-    if _try_json_loads(text) is not None:
-        return text
-
-    # Fix literal newlines/tabs inside JSON strings.
-    repaired = _fix_literal_newlines_in_strings(text)
-    if _try_json_loads(repaired) is not None:
-        return repaired
+def _decode_string_at(text: str, start: int) -> str | None:
+    """Decode the JSON string body beginning at ``start`` (just past its opening quote)."""
+    try:
+        return scanstring(text, start)[0]
+    except ValueError:
+        return None
 
-    # Try removing trailing commas before ] or }.
-    repaired2 = re.sub(r',\s*([}\]])', r'\1', repaired)
-    if _try_json_loads(repaired2) is not None:
-        return repaired2
 
-    # Try truncation repair — close open braces/brackets.
-    repaired3 = _fix_truncated_json(repaired2)
-    if repaired3 and _try_json_loads(repaired3) is not None:
-        return repaired3
+def _loads_repaired(text: str) -> dict | list | None:
+    """Parse LLM JSON, repairing it first if a direct parse fails."""
+    parsed = _try_json_loads(text)
+    if parsed is None:
+        parsed = _try_json_loads(_repair_json(text))
+    return parsed
 
-    # Return best attempt even if still broken.
-    return repaired
 
+def _repair_json(text: str) -> str:
+    """Attempt to repair common JSON issues from LLM output.
 
-def _fix_literal_newlines_in_strings(text: str) -> str:
-    """Replace literal newlines/tabs inside JSON string values with escape sequences.
+    The #1 problem: LLMs put literal newlines inside JSON string values
+    (the "content" field with source code). Standard JSON requires \\n instead.
 
-    Walks the JSON character by character, tracking whether we're inside a string.
-    Inside strings: literal \\n -> \\\\n, literal \\r -> \\\\r, literal \\t -> \\\\t.
+    One forward pass over string literals and structural characters:
+    - literal newlines/tabs inside strings become escape sequences
+    - a comma directly before ] or } (outside strings) is dropped
+    - a truncated document gets its open string, then brackets, then braces
+      closed
     """
-    output = []
-    i = 0
-    in_string = False
-
-    while i < len(text):
-        ch = text[i]
-
-        if not in_string:
-            if ch == '"':
-                in_string = True
-            output.append(ch)
-        else:
-            # Inside a JSON string.
-            if ch == '\\':
-                # Escaped character — keep the escape pair as-is.
-                if i + 1 < len(text):
-                    output.append(ch)
-                    output.append(text[i + 1])
-                    i += 2
-                    continue
-                else:
-                    output.append(ch)
-            elif ch == '"':
-                in_string = False
-                output.append(ch)
-            elif ch == '\n':
-                output.append('\\n')
-            elif ch == '\r':
-                output.append('\\r')
-            elif ch == '\t':
-                output.append('\\t')
-            else:
-                output.append(ch)
-
-        i += 1
-
-    return "".join(output)
-
-
-def _fix_truncated_json(text: str) -> str | None:
-    """Try to close a truncated JSON object by adding missing brackets/braces."""
+    parts: list[str] = []   # unchanged spans of text, interleaved with edits
+    copied = 0              # text[:copied] is already in parts
     open_braces = 0
     open_brackets = 0
-    in_string = False
-    i = 0
+    comma_at = -1   # offset of a comma with only whitespace after it
+    pos = 0
+    unterminated = False
 
-    while i < len(text):
-        ch = text[i]
-        if in_string:
-            if ch == '\\' and i + 1 < len(text):
-                i += 2
-                continue
-            elif ch == '"':
-                in_string = False
+    for m in _JSON_TOKEN_RE.finditer(text):
+        start, end = m.span()
+        if comma_at != -1 and start > pos and not text[pos:start].isspace():
+            comma_at = -1
+        pos = end
+        ch = text[start]
+
+        if ch == '"':
+            # Only strings that actually need escaping are copied out.
+            if (
+                text.find("\n", start, end) != -1
+                or text.find("\r", start, end) != -1
+                or text.find("\t", start, end) != -1
+            ):
+                parts.append(text[copied:start])
+                parts.append(_escape_control_chars(text[start:end]))
+                copied = end
+            comma_at = -1
+            unterminated = end == len(text) and (
+                end - start == 1 or text[end - 1] != '"' or _ends_in_escape(text[start:end])
+            )
+        elif ch == ",":
+            comma_at = start
         else:
-            if ch == '"':
-                in_string = True
-            elif ch == '{':
+            if ch in "}]" and comma_at != -1:
+                parts.append(text[copied:comma_at])
+                copied = comma_at + 1
+            if ch == "{":
                 open_braces += 1
-            elif ch == '}':
+            elif ch == "}":
                 open_braces -= 1
-            elif ch == '[':
+            elif ch == "[":
                 open_brackets += 1
-            elif ch == ']':
+            else:
                 open_brackets -= 1
-        i += 1
-
-    if open_braces <= 0 and open_brackets <= 0:
-        return None
+            comma_at = -1
+
+    truncated = open_braces > 0 or open_brackets > 0
+    end = len(text)
+    if truncated:
+        # Trailing whitespace goes before the closers are appended.
+        while end > copied and text[end - 1].isspace():
+            end -= 1
+    parts.append(text[copied:end])
+
+    # Truncation repair — close open brackets/braces.
+    if truncated:
+        if end == copied:
+            # The whitespace run reaches back into earlier parts.
+            while parts and (not parts[-1] or parts[-1].isspace()):
+                parts.pop()
+            if parts:
+                parts[-1] = parts[-1].rstrip()
+        if unterminated:
+            parts.append('"')
+        parts.append("]" * max(0, open_brackets))
+        parts.append("}" * max(0, open_braces))
+
+    return "".join(parts)
+
+
+def _escape_control_chars(tok: str) -> str:
+    """Escape literal newlines/tabs in a string literal.
+
+    Each containment test and replace is a single C-level scan, which is far
+    cheaper than str.translate()'s per-character mapping on large code blobs.
+    """
+    if "\n" in tok:
+        tok = tok.replace("\n", "\\n")
+    if "\r" in tok:
+        tok = tok.replace("\r", "\\r")
+    if "\t" in tok:
+        tok = tok.replace("\t", "\\t")
+    return tok
 
-    suffix = ""
-    if in_string:
-        suffix += '"'
-    suffix += ']' * max(0, open_brackets)
-    suffix += '}' * max(0, open_braces)
 
-    return text.rstrip() + suffix
+def _ends_in_escape(tok: str) -> bool:
+    """True if the final quote of a matched string literal is itself escaped."""
+    run = len(tok) - 1 - len(tok[:-1].rstrip("\\"))
+    return run % 2 == 1
 
 
 # ---------------------------------------------------------------------------
@@ -163,19 +194,13 @@ def _fix_truncated_json(text: str) -> str | None:
 
 
 def _strip_markdown_fences(text: str) -> str:
-    """Remove outermost markdown code fences if present."""
-    result = text
-    for _ in range(3):
-        m = re.search(r"```(?:json)?\s*\n?([\s\S]*?)```", result)
-        if m:
-            inner = m.group(1).strip()
-            if inner and (inner[0] in '{[' or '"' in inner[:20]):
-                result = inner
-            else:
-                break
-        else:
-            break
-    return result
+    """Remove the first markdown code fence if it wraps a JSON payload."""
+    m = _FENCE_RE.search(text)
+    if m:
+        inner = m.group(1).strip()
+        if inner and (inner[0] in '{[' or '"' in inner[:20]):
+            return inner
+    return text
 
 
 def _salvage_truncated_response(content: str) -> PlannerResponse:
@@ -185,68 +210,89 @@ def _salvage_truncated_response(content: str) -> PlannerResponse:
     tasks: list[RawTaskInput] = []
 
     # Try to extract the scratchpad string.
-    sp_match = re.search(r'"scratchpad"\s*:\s*"((?:[^"\\]|\\.)*)"', content)
+    sp_match = _SCRATCHPAD_RE.search(content)
     if sp_match:
-        try:
-            scratchpad = json.loads(f'"{sp_match.group(1)}"')
-        except Exception:
+        scratchpad = _decode_string_at(content, sp_match.start(1))
+        if scratchpad is None:
             scratchpad = sp_match.group(1)
 
-    # Locate "tasks": [ and walk character-by-character to extract each {...}.
-    tk_match = re.search(r'"tasks"\s*:\s*\[', content)
+    # Locate "tasks": [ and decode the complete objects that follow it.
+    tk_match = _TASKS_ARR_RE.search(content)
     if not tk_match:
         return PlannerResponse(scratchpad=scratchpad, tasks=tasks)
 
-    remainder = content[tk_match.end():]
-    depth = 0
-    obj_start = -1
-    i = 0
+    items, stop, closed = _decode_array_items(content, tk_match.end())
+    tasks.extend(
+        _dict_to_raw(raw) for raw in items if isinstance(raw, dict) and raw.get("description")
+    )
+    if closed:
+        return PlannerResponse(scratchpad=scratchpad, tasks=tasks)
 
-    while i < len(remainder):
-        ch = remainder[i]
+    # Decoding stopped at a malformed or truncated item — brace-match the
+    # rest, repairing each {...} found.
+    for obj_str in _iter_object_spans(content, stop):
+        raw = _loads_repaired(obj_str)
+        if isinstance(raw, dict) and raw.get("description"):
+            tasks.append(_dict_to_raw(raw))
 
-        # Skip over JSON string literals to avoid counting braces inside them.
-        if ch == '"':
-            i += 1
-            while i < len(remainder):
-                if remainder[i] == '\\':
-                    i += 1  # skip escaped char
-                elif remainder[i] == '"':
-                    break
-                i += 1
-            i += 1
-            continue
-
-        if ch == '{':
+    return PlannerResponse(scratchpad=scratchpad, tasks=tasks)
+
+
+def _decode_array_items(text: str, idx: int) -> tuple[list, int, bool]:
+    """Decode consecutive JSON array items starting at ``idx``.
+
+    Returns (items, stop, closed): ``stop`` is where decoding ended, and
+    ``closed`` is True if it ended at the array's closing bracket.
+    """
+    items = []
+    end = len(text)
+    while True:
+        idx = _ARRAY_SEP_RE.match(text, idx).end()
+        if idx >= end:
+            return items, idx, False
+        if text[idx] == "]":
+            return items, idx, True
+        try:
+            item, idx = _DECODER.raw_decode(text, idx)
+        except ValueError:
+            return items, idx, False
+        items.append(item)
+
+
+def _iter_object_spans(text: str, pos: int, stop_at_close: bool = False) -> Iterator[str]:
+    """Yield each complete depth-0 {...} in ``text`` from ``pos`` onwards.
+
+    Walks the same token stream as _repair_json(), so string literals are
+    skipped whole. With ``stop_at_close``, a ``]`` at depth 0 (the end of the
+    enclosing array) ends the walk.
+    """
+    depth = 0
+    obj_start = -1
+    for m in _JSON_TOKEN_RE.finditer(text, pos):
+        i = m.start()
+        ch = text[i]
+        if ch == "{":
             if depth == 0:
                 obj_start = i
             depth += 1
-        elif ch == '}':
+        elif ch == "}":
             depth -= 1
             if depth == 0 and obj_start != -1:
-                obj_str = remainder[obj_start:i + 1]
-                # Try direct parse, then repair.
-                raw = _try_json_loads(obj_str)
-                if raw is None:
-                    repaired = _repair_json(obj_str)
-                    raw = _try_json_loads(repaired)
-                if isinstance(raw, dict) and raw.get("description"):
-                    tasks.append(_dict_to_raw(raw))
+                yield text[obj_start:i + 1]
                 obj_start = -1
-
-        i += 1
-
-    return PlannerResponse(scratchpad=scratchpad, tasks=tasks)
+        elif ch == "]" and stop_at_close and depth == 0:
+            return
 
 
 def _dict_to_raw(d: dict) -> RawTaskInput:
+    get = d.get
     return RawTaskInput(
-        id=d.get("id"),
-        description=d.get("description", ""),
-        scope=d.get("scope"),
-        acceptance=d.get("acceptance"),
-        priority=d.get("priority"),
-        team=d.get("team"),
+        get("id"),
+        get("description", ""),
+        get("scope"),
+        get("acceptance"),
+        get("priority"),
+        get("team"),
     )
 
 
@@ -261,18 +307,44 @@ def parse_planner_response(content: str) -> PlannerResponse:
     - Bare task arrays (no scratchpad key)
     """
     try:
-        cleaned = _strip_markdown_fences(content.strip())
+        stripped = content.strip()
+
+        # Fast path: bare JSON needs no fence stripping or brace hunting.
+        if stripped[:1] in ("{", "["):
+            parsed = _try_json_loads(stripped)
+            if isinstance(parsed, dict) and isinstance(parsed.get("tasks"), list):
+                return PlannerResponse(
+                    scratchpad=parsed.get("scratchpad", ""),
+                    tasks=[_dict_to_raw(t) for t in parsed["tasks"] if isinstance(t, dict)],
+                )
+            if isinstance(parsed, list):
+                return PlannerResponse(
+                    scratchpad="",
+                    tasks=[_dict_to_raw(t) for t in parsed if isinstance(t, dict)],
+                )
+
+        cleaned = _strip_markdown_fences(stripped)
 
         obj_start = cleaned.find("{")
+        if obj_start != -1:
+            # Let the decoder find where the first object ends; this also
+            # ignores any prose or second object after it.
+            try:
+                parsed = _DECODER.raw_decode(cleaned, obj_start)[0]
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, dict) and isinstance(parsed.get("tasks"), list):
+                return PlannerResponse(
+                    scratchpad=parsed.get("scratchpad", ""),
+                    tasks=[_dict_to_raw(t) for t in parsed["tasks"] if isinstance(t, dict)],
+                )
+
         obj_end = cleaned.rfind("}")
         if obj_start != -1 and obj_end > obj_start:
             candidate = cleaned[obj_start:obj_end + 1]
 
             # Try direct parse first, then repair.
-            parsed = _try_json_loads(candidate)
-            if parsed is None:
-                repaired = _repair_json(candidate)
-                parsed = _try_json_loads(repaired)
+            parsed = _loads_repaired(candidate)
 
             if (
                 isinstance(parsed, dict)
@@ -300,7 +372,8 @@ def parse_planner_response(content: str) -> PlannerResponse:
         tasks = parse_llm_task_array(content)
         return PlannerResponse(scratchpad="", tasks=tasks)
     except Exception:
-        logger.warning("Failed to parse planner response: %s...", content[:300])
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Failed to parse planner response: %s...", content[:300])
         return PlannerResponse(scratchpad="", tasks=[])
 
 
@@ -316,14 +389,22 @@ def parse_llm_task_array(content: str) -> list[RawTaskInput]:
             cleaned = cleaned[first_nl + 1:last_bt].strip()
 
     arr_start = cleaned.find("[")
-    arr_end = cleaned.rfind("]")
-    if arr_start != -1 and arr_end > arr_start:
-        cleaned = cleaned[arr_start:arr_end + 1]
+    if arr_start != -1:
+        # The decoder finds the end of the array itself; only a malformed
+        # array needs the slice-and-repair path below.
+        try:
+            parsed = _DECODER.raw_decode(cleaned, arr_start)[0]
+        except ValueError:
+            arr_end = cleaned.rfind("]")
+            if arr_end > arr_start:
+                cleaned = cleaned[arr_start:arr_end + 1]
+            # A direct parse of the slice would fail the same way.
+            parsed = _try_json_loads(_repair_json(cleaned))
+    else:
+        parsed = _loads_repaired(cleaned)
 
-    parsed = _try_json_loads(cleaned)
     if parsed is None:
-        repaired = _repair_json(cleaned)
-        parsed = json.loads(repaired)
+        raise ValueError("LLM response is not valid JSON")
 
     if not isinstance(parsed, list):
         raise ValueError("LLM response is not an array")
@@ -344,25 +425,33 @@ def parse_worker_response(content: str, task_id: str) -> WorkerResult:
     - JSON wrapped in markdown fences
     - Truncated JSON (salvages individual file operations)
     """
-    cleaned = _strip_markdown_fences(content.strip())
-
-    # Find outermost JSON object.
-    obj_start = cleaned.find("{")
-    obj_end = cleaned.rfind("}")
-    if obj_start == -1 or obj_end <= obj_start:
-        logger.error("Worker response has no JSON object for task %s", task_id)
-        return _make_failure_result(task_id, "No JSON object in worker response")
+    stripped = content.strip()
+
+    # Fast path: a well-behaved model returns the bare object, which needs no
+    # fence stripping or brace hunting (and code fences inside file contents
+    # must not be mistaken for a wrapper).
+    parsed = _try_json_loads(stripped) if stripped[:1] == "{" else None
+    if parsed is not None:
+        candidate = stripped
+    else:
+        cleaned = _strip_markdown_fences(stripped)
+
+        # Find outermost JSON object.
+        obj_start = cleaned.find("{")
+        obj_end = cleaned.rfind("}")
+        if obj_start == -1 or obj_end <= obj_start:
+            logger.error("Worker response has no JSON object for task %s", task_id)
+            return _make_failure_result(task_id, "No JSON object in worker response")
 
-    candidate = cleaned[obj_start:obj_end + 1]
+        candidate = cleaned[obj_start:obj_end + 1]
 
-    # Try direct parse first.
-    parsed = _try_json_loads(candidate)
+        # Try direct parse first.
+        parsed = _try_json_loads(candidate)
 
     # If direct fails, try JSON repair (handles literal newlines in strings).
     if parsed is None:
         logger.debug("Worker JSON direct parse failed for %s — attempting repair", task_id)
-        repaired = _repair_json(candidate)
-        parsed = _try_json_loads(repaired)
+        parsed = _try_json_loads(_repair_json(candidate))
 
     # If repair also fails, try salvage.
     if parsed is None:
@@ -381,20 +470,29 @@ def parse_worker_response(content: str, task_id: str) -> WorkerResult:
         task_id=task_id,
         status=handoff_raw.get("status", "complete"),
         summary=handoff_raw.get("summary", ""),
-        files_changed=[str(f) for f in handoff_raw.get("files_changed", [])],
-        concerns=[str(c) for c in handoff_raw.get("concerns", [])],
-        suggestions=[str(s) for s in handoff_raw.get("suggestions", [])],
+        files_changed=_ensure_str_list(handoff_raw.get("files_changed", [])),
+        concerns=_ensure_str_list(handoff_raw.get("concerns", [])),
+        suggestions=_ensure_str_list(handoff_raw.get("suggestions", [])),
     )
 
-    # Build file operations.
-    file_operations: list[FileOperation] = []
-    for op in file_ops_raw:
-        if isinstance(op, dict) and "path" in op and "content" in op:
-            file_operations.append(FileOperation(path=op["path"], content=op["content"]))
+    # Build file operations. They reference the decoded strings rather than
+    # copying them, so only the small per-item dicts are duplicated.
+    file_operations = [
+        FileOperation(path=op["path"], content=op["content"])
+        for op in file_ops_raw
+        if isinstance(op, dict) and "path" in op and "content" in op
+    ]
 
     return WorkerResult(handoff=handoff, file_operations=file_operations)
 
 
+def _ensure_str_list(items) -> list[str]:
+    """Coerce items to str, reusing the decoded list when it already is one."""
+    if type(items) is list and all(type(x) is str for x in items):
+        return items
+    return [str(x) for x in items]
+
+
 def _salvage_worker_response(content: str, task_id: str) -> WorkerResult:
     """Try to extract whatever we can from a malformed worker response.
 
@@ -404,60 +502,37 @@ def _salvage_worker_response(content: str, task_id: str) -> WorkerResult:
     """
     file_operations: list[FileOperation] = []
 
-    # Strategy 1: Brace-match individual objects inside file_operations.
-    fo_match = re.search(r'"file_operations"\s*:\s*\[', content)
+    # Strategy 1: Decode individual objects inside file_operations, falling
+    # back to brace-matching with per-object repair from the first bad one.
+    fo_match = _FILE_OPS_RE.search(content)
     if fo_match:
-        remainder = content[fo_match.end():]
-        depth = 0
-        obj_start = -1
-        i = 0
-        in_string = False
-
-        while i < len(remainder):
-            ch = remainder[i]
-
-            if in_string:
-                if ch == '\\' and i + 1 < len(remainder):
-                    i += 2
-                    continue
-                elif ch == '"':
-                    in_string = False
-            else:
-                if ch == '"':
-                    in_string = True
-                elif ch == '{':
-                    if depth == 0:
-                        obj_start = i
-                    depth += 1
-                elif ch == '}':
-                    depth -= 1
-                    if depth == 0 and obj_start != -1:
-                        obj_str = remainder[obj_start:i + 1]
-                        raw = _try_json_loads(obj_str)
-                        if raw is None:
-                            repaired_obj = _repair_json(obj_str)
-                            raw = _try_json_loads(repaired_obj)
-                        if isinstance(raw, dict) and "path" in raw and "content" in raw:
-                            file_operations.append(
-                                FileOperation(path=raw["path"], content=raw["content"])
-                            )
-                        obj_start = -1
-                elif ch == ']' and depth == 0:
-                    break
-
-            i += 1
+        items, stop, closed = _decode_array_items(content, fo_match.end())
+        for raw in items:
+            if isinstance(raw, dict) and "path" in raw and "content" in raw:
+                file_operations.append(FileOperation(path=raw["path"], content=raw["content"]))
+        if not closed:
+            for obj_str in _iter_object_spans(content, stop, stop_at_close=True):
+                raw = _loads_repaired(obj_str)
+                if isinstance(raw, dict) and "path" in raw and "content" in raw:
+                    file_operations.append(
+                        FileOperation(path=raw["path"], content=raw["content"])
+                    )
 
     # Strategy 2: Fallback regex for simple cases.
     if not file_operations:
-        for m in re.finditer(r'\{\s*"path"\s*:\s*"([^"]+)"\s*,\s*"content"\s*:\s*"', content):
+        for m in _FILE_OP_HEAD_RE.finditer(content):
             path = m.group(1)
             start = m.end()
             end = _find_string_end(content, start)
             if end > start:
                 raw_content = content[start:end]
-                try:
-                    decoded = json.loads(f'"{raw_content}"')
-                except Exception:
+                # Decode in place when the closing quote exists; a truncated
+                # value is decoded as if it had been closed.
+                if end < len(content):
+                    decoded = _decode_string_at(content, start)
+                else:
+                    decoded = _decode_string_at(raw_content + '"', 0)
+                if decoded is None:
                     decoded = raw_content.replace('\\n', '\n').replace('\\t', '\t')
                 file_operations.append(FileOperation(path=path, content=decoded))
 
@@ -465,14 +540,13 @@ def _salvage_worker_response(content: str, task_id: str) -> WorkerResult:
     status = "partial" if file_operations else "failed"
     summary = f"Salvaged {len(file_operations)} file operations from malformed response"
 
-    h_match = re.search(r'"status"\s*:\s*"([^"]+)"', content)
+    h_match = _STATUS_RE.search(content)
     if h_match:
         status = h_match.group(1)
-    s_match = re.search(r'"summary"\s*:\s*"((?:[^"\\]|\\.)*)"', content)
+    s_match = _SUMMARY_RE.search(content)
     if s_match:
-        try:
-            summary = json.loads(f'"{s_match.group(1)}"')
-        except Exception:
+        summary = _decode_string_at(content, s_match.start(1))
+        if summary is None:
             summary = s_match.group(1)
 
     logger.info(
@@ -496,15 +570,17 @@ def _salvage_worker_response(content: str, task_id: str) -> WorkerResult:
 def _find_string_end(text: str, start: int) -> int:
     """Find the end of a JSON string value starting at `start` (after opening quote)."""
     i = start
-    while i < len(text):
-        ch = text[i]
-        if ch == '\\':
-            i += 2
-            continue
-        if ch == '"':
-            return i
-        i += 1
-    return len(text)
+    while True:
+        # Hop quote to quote; only the backslash run before each one is walked.
+        j = text.find('"', i)
+        if j == -1:
+            return len(text)
+        k = j
+        while k > start and text[k - 1] == '\\':
+            k -= 1
+        if (j - k) % 2 == 0:
+            return j
+        i = j + 1
 
 
 def _make_failure_result(task_id: str, reason: str) -> WorkerResult:
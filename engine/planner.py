@@ -1,15 +1,17 @@
 """Manager planning loop — iterative LLM-driven task decomposition.
 
 Ported from packages/orchestrator/src/planner.ts.  The core loop pattern is:
-500ms ticks → check planning triggers → call LLM → parse → dispatch tasks →
-collect handoffs → repeat until done.
+wake on a handoff (or a 500ms tick at most) → check planning triggers → call
+LLM → parse → dispatch tasks → collect handoffs → repeat until done.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
+from collections import deque
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -17,7 +19,7 @@ from .config import Config
 from .events import EngineEvent, EventBus, EventType
 from .gemini import GeminiClient, LLMMessage
 from .parsing import PlannerResponse, RawTaskInput, parse_planner_response
-from .project_state import read_project_state
+from .project_state import ProjectState, read_project_state
 from .types import Handoff, HandoffMetrics, Task, TaskStatus, TeamRole
 
 if TYPE_CHECKING:
@@ -38,15 +40,25 @@ MAX_FILES_PER_HANDOFF = 30
 # this many characters total, we compact to keep context manageable.
 CONVERSATION_COMPACTION_CHARS = 200_000
 
+# After compaction the kept recent messages should fit in this budget, so one
+# oversized exchange doesn't push the conversation straight back over.
+COMPACTED_RECENT_CHARS = CONVERSATION_COMPACTION_CHARS // 2
+
+# Lines longer than this in older planner prompts are dumps (stack traces,
+# JSON blobs) rather than facts later plans refer back to; compaction drops
+# them verbatim before resorting to summarizing.
+PRUNE_LINE_MAX_CHARS = 500
+
 # Max times we'll nudge the LLM to emit engineering tasks before giving up.
 MAX_EMPTY_PLAN_NUDGES = 3
 
 # Source code extensions — files that count as "real project output" (not just docs).
-_SOURCE_EXTENSIONS = {
+# A tuple so str.endswith() can test every suffix in one C-level call.
+_SOURCE_EXTENSIONS = (
     ".py", ".js", ".ts", ".jsx", ".tsx", ".html", ".css", ".scss",
     ".java", ".c", ".cpp", ".h", ".hpp", ".go", ".rs", ".rb",
     ".php", ".swift", ".kt", ".cs", ".r", ".lua", ".sh", ".bat",
-}
+)
 
 
 class Planner:
@@ -68,29 +80,43 @@ class Planner:
         self.client = client
         self.worker_pool = worker_pool
         self.system_prompt = system_prompt
+        self._system_msg = LLMMessage(role="system", content=system_prompt)
         self.subplanner = subplanner
         self.event_bus = event_bus
 
         # Conversation state.
         self.conversation: list[LLMMessage] = []
+        self._conv_chars = 0  # running sum of len(m.content) over conversation
+        self._msg_lens: list[int] = []  # len(m.content) per message, parallel to conversation
         self.scratchpad = ""
 
         # Handoff tracking.
         self.all_handoffs: list[Handoff] = []
         self.handoffs_since_last_plan: list[Handoff] = []
-        self.pending_handoffs: list[tuple[Task, Handoff]] = []
+        self.pending_handoffs: deque[tuple[Task, Handoff]] = deque()
 
         # Task tracking.
         self.active_tasks: set[str] = set()
         self.dispatched_ids: set[str] = set()
         self.all_tasks: list[Task] = []
+        self._tasks_by_id: dict[str, Task] = {}
         self.task_counter = 0
 
         # Delta tracking for follow-ups.
         self._prev_file_tree: set[str] = set()
+        self._prev_file_list: list[str] = []  # same tree, in order, for a cheap equality check
+        self._last_state: ProjectState | None = None  # read by the latest _plan()
 
         self._running = False
-        self._injected_tasks: list[Task] = []
+        self._injected_tasks: deque[Task] = deque()
+
+        # Set when a handoff or injected task arrives, so the loop reacts
+        # immediately instead of on its next tick.
+        self._wakeup = asyncio.Event()
+
+        # Events raised within one loop tick, published together by
+        # _flush_events() before the loop next yields.
+        self._pending_emit: list[EngineEvent] = []
 
         # Nudge tracking — prevents premature termination when no source files exist.
         self._empty_plan_nudges = 0
@@ -100,10 +126,19 @@ class Planner:
         if self.event_bus:
             self.event_bus.emit(event)
 
+    def _emit_many(self, events: list[EngineEvent]) -> None:
+        if self.event_bus:
+            self.event_bus.emit_many(events)
+
+    def _flush_events(self) -> None:
+        if self._pending_emit:
+            self._emit_many(self._pending_emit)
+            self._pending_emit = []
+
     async def run_loop(self, request: str) -> None:
         """Main entry point — runs the planning loop until all work is done."""
         self._running = True
-        self.conversation = [LLMMessage(role="system", content=self.system_prompt)]
+        self._set_conversation([self._system_msg])
 
         iteration = 0
         planning_done = False
@@ -117,7 +152,7 @@ class Planner:
 
             # Inject reconciler fix tasks if any.
             if self._injected_tasks:
-                injected = self._injected_tasks[:]
+                injected = list(self._injected_tasks)
                 self._injected_tasks.clear()
                 logger.info("Injecting %d fix tasks from reconciler", len(injected))
                 self._dispatch_tasks(injected)
@@ -161,12 +196,13 @@ class Planner:
 
                 except Exception as e:
                     consecutive_errors += 1
-                    backoff_s = min(
+                    # Full jitter, so planners throttled together don't retry in lockstep.
+                    backoff_s = random.uniform(0, min(
                         (BACKOFF_BASE_MS / 1000) * (2 ** (consecutive_errors - 1)),
                         BACKOFF_MAX_MS / 1000,
-                    )
+                    ))
                     logger.error(
-                        "Planning failed (attempt %d), retrying in %.0fs: %s",
+                        "Planning failed (attempt %d), retrying in %.1fs: %s",
                         consecutive_errors,
                         backoff_s,
                         e,
@@ -174,6 +210,7 @@ class Planner:
                     if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
                         logger.error("Aborting after %d consecutive failures", MAX_CONSECUTIVE_ERRORS)
                         break
+                    self._flush_events()
                     await asyncio.sleep(backoff_s)
                     continue
 
@@ -181,12 +218,16 @@ class Planner:
             if planning_done and not self.active_tasks:
                 break
 
-            await asyncio.sleep(LOOP_SLEEP_MS / 1000)
+            self._flush_events()
+            await self._wait_for_wakeup()
+
+        self._flush_events()
 
         # Wait for any remaining active tasks.
         while self.active_tasks and self._running:
             self._collect_completed_handoffs()
-            await asyncio.sleep(LOOP_SLEEP_MS / 1000)
+            if self.active_tasks:
+                await self._wait_for_wakeup()
 
         self._running = False
         logger.info(
@@ -196,16 +237,29 @@ class Planner:
             len(self.all_handoffs),
         )
 
+    async def _wait_for_wakeup(self) -> None:
+        """Sleep until new work arrives, capped at one loop tick.
+
+        The cap keeps time-based triggers (e.g. freed worker capacity)
+        firing even when nothing signals the event.
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=LOOP_SLEEP_MS / 1000)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
     async def _plan(self, request: str, iteration: int) -> list[Task]:
         """Build the prompt, call LLM, parse response, return new Task objects."""
         state = read_project_state(self.config.output_dir)
+        self._last_state = state
 
         if iteration == 0:
             msg = self._build_initial_message(request, state.file_tree)
         else:
             msg = self._build_follow_up_message(state.file_tree)
 
-        self.conversation.append(LLMMessage(role="user", content=msg))
+        self._append_message(LLMMessage(role="user", content=msg))
         self._maybe_compact_conversation()
 
         logger.info(
@@ -216,21 +270,24 @@ class Planner:
             len(self.dispatched_ids),
         )
 
-        self._emit(EngineEvent(
+        # Goes out with any fix tasks injected this tick, ahead of the LLM call.
+        self._pending_emit.append(EngineEvent(
             type=EventType.PLANNING_ITERATION,
             data={"iteration": iteration + 1},
         ))
+        self._flush_events()
 
         response = await self.client.complete(self.conversation)
 
         # Add assistant response to conversation history.
-        self.conversation.append(LLMMessage(role="assistant", content=response.content))
+        self._append_message(LLMMessage(role="assistant", content=response.content))
 
         # Parse.
         parsed = parse_planner_response(response.content)
         if parsed.scratchpad:
             self.scratchpad = parsed.scratchpad
-            logger.debug("Scratchpad: %s", self.scratchpad[:500])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Scratchpad: %s", self.scratchpad[:500])
 
         # Build Task objects.
         tasks = self._build_tasks_from_raw(parsed.tasks)
@@ -243,29 +300,32 @@ class Planner:
         )
 
         # Update delta tracking.
-        self._prev_file_tree = set(state.file_tree)
+        if state.file_tree != self._prev_file_list:
+            self._prev_file_list = state.file_tree
+            self._prev_file_tree = set(state.file_tree)
 
         return tasks
 
     def _build_initial_message(self, request: str, file_tree: list[str]) -> str:
-        parts = [
+        tree = "\n".join(file_tree) if file_tree else "(empty project — nothing built yet)"
+        return "\n".join((
             f"## User Request\n{request}\n",
-            f"## Project File Tree\n",
-        ]
-        if file_tree:
-            parts.append("\n".join(file_tree))
-        else:
-            parts.append("(empty project — nothing built yet)")
-        parts.append("\n\nThis is the initial planning call. Analyze the request and produce your first batch of tasks.")
-        return "\n".join(parts)
+            "## Project File Tree\n",
+            tree,
+            "\n\nThis is the initial planning call. Analyze the request and produce your first batch of tasks.",
+        ))
 
     def _build_follow_up_message(self, file_tree: list[str]) -> str:
         parts: list[str] = []
 
-        # Delta file tree.
-        current_set = set(file_tree)
-        new_files = sorted(current_set - self._prev_file_tree)
-        removed_files = sorted(self._prev_file_tree - current_set)
+        # Delta file tree. The tree is sorted, so an unchanged one compares equal.
+        if file_tree == self._prev_file_list:
+            new_files: list[str] = []
+            removed_files: list[str] = []
+        else:
+            current_set = set(file_tree)
+            new_files = sorted(current_set - self._prev_file_tree)
+            removed_files = sorted(self._prev_file_tree - current_set)
 
         parts.append("## Project State Update\n")
         if new_files:
@@ -287,22 +347,23 @@ class Planner:
                     summary += "..."
                 parts.append(f"Summary: {summary}")
 
-                files = [str(f) for f in h.files_changed[:MAX_FILES_PER_HANDOFF]]
-                if len(h.files_changed) > MAX_FILES_PER_HANDOFF:
-                    files.append(f"... ({len(h.files_changed) - MAX_FILES_PER_HANDOFF} more)")
-                parts.append(f"Files changed: {', '.join(files)}")
+                n_files = len(h.files_changed)
+                files = ", ".join(map(str, h.files_changed[:MAX_FILES_PER_HANDOFF]))
+                if n_files > MAX_FILES_PER_HANDOFF:
+                    files += f", ... ({n_files - MAX_FILES_PER_HANDOFF} more)"
+                parts.append("Files changed: " + files)
 
                 if h.concerns:
-                    parts.append(f"Concerns: {'; '.join(str(c) for c in h.concerns)}")
+                    parts.append("Concerns: " + "; ".join(map(str, h.concerns)))
                 if h.suggestions:
-                    parts.append(f"Suggestions: {'; '.join(str(s) for s in h.suggestions)}")
+                    parts.append("Suggestions: " + "; ".join(map(str, h.suggestions)))
                 parts.append("")
 
         # Active tasks.
         if self.active_tasks:
             parts.append(f"\n## Currently Active Tasks ({len(self.active_tasks)})")
             for tid in sorted(self.active_tasks):
-                task = next((t for t in self.all_tasks if t.id == tid), None)
+                task = self._tasks_by_id.get(tid)
                 if task:
                     parts.append(f"- {tid}: {task.description[:120]}")
             parts.append("")
@@ -369,7 +430,11 @@ class Planner:
         return tasks
 
     def _dispatch_tasks(self, tasks: list[Task]) -> None:
-        """Fire-and-forget dispatch of tasks to workers/subplanners."""
+        """Fire-and-forget dispatch of tasks to workers/subplanners.
+
+        TASK_DISPATCHED events are buffered; the caller flushes them before
+        yielding, which is also before any dispatched task can start.
+        """
         for task in tasks:
             if task.id in self.dispatched_ids:
                 continue
@@ -377,6 +442,7 @@ class Planner:
             self.dispatched_ids.add(task.id)
             self.active_tasks.add(task.id)
             self.all_tasks.append(task)
+            self._tasks_by_id[task.id] = task
 
             logger.info(
                 "Dispatching task %s (team=%s, scope=%d, priority=%d): %s",
@@ -387,7 +453,7 @@ class Planner:
                 task.description[:100],
             )
 
-            self._emit(EngineEvent(
+            self._pending_emit.append(EngineEvent(
                 type=EventType.TASK_DISPATCHED,
                 task_id=task.id,
                 parent_id=task.parent_id,
@@ -413,6 +479,7 @@ class Planner:
                 handoff = await self.worker_pool.execute_task(task)
 
             self.pending_handoffs.append((task, handoff))
+            self._wakeup.set()
 
         except Exception as e:
             logger.error("Task %s dispatch failed: %s", task.id, e)
@@ -426,18 +493,29 @@ class Planner:
                     metrics=HandoffMetrics(duration_ms=0),
                 ),
             ))
+            self._wakeup.set()
 
     def _collect_completed_handoffs(self) -> None:
         """Drain pending handoffs into the accumulator lists."""
         while self.pending_handoffs:
-            task, handoff = self.pending_handoffs.pop(0)
+            task, handoff = self.pending_handoffs.popleft()
             self.all_handoffs.append(handoff)
             self.handoffs_since_last_plan.append(handoff)
             self.active_tasks.discard(task.id)
 
+    def _append_message(self, message: LLMMessage) -> None:
+        self.conversation.append(message)
+        self._msg_lens.append(len(message.content))
+        self._conv_chars += self._msg_lens[-1]
+
+    def _set_conversation(self, messages: list[LLMMessage]) -> None:
+        self.conversation = messages
+        self._msg_lens = [len(m.content) for m in messages]
+        self._conv_chars = sum(self._msg_lens)
+
     def _maybe_compact_conversation(self) -> None:
         """If the conversation is too long, compact to avoid context overflow."""
-        total_chars = sum(len(m.content) for m in self.conversation)
+        total_chars = self._conv_chars
         if total_chars <= CONVERSATION_COMPACTION_CHARS:
             return
 
@@ -447,14 +525,39 @@ class Planner:
             CONVERSATION_COMPACTION_CHARS,
         )
 
+        # First prune low-signal lines from the older prompts, keeping every
+        # remaining line verbatim (task IDs, paths and errors survive intact).
+        pruned = self.conversation[:]
+        for i in range(2, len(pruned) - 10):
+            msg = pruned[i]
+            if msg.role == "user":
+                pruned[i] = LLMMessage(role="user", content=self._prune_message(msg.content))
+        self._set_conversation(pruned)
+        if self._conv_chars <= CONVERSATION_COMPACTION_CHARS:
+            logger.info(
+                "Conversation pruned: %d → %d chars",
+                total_chars,
+                self._conv_chars,
+            )
+            return
+
         # Keep: system prompt (index 0), first user msg (index 1), last 5 exchanges.
         system_msg = self.conversation[0]
-        first_user = self.conversation[1] if len(self.conversation) > 1 else None
-        recent = self.conversation[-10:]  # last 5 exchanges = 10 messages
+        # Last 5 exchanges = 10 messages, trimmed an exchange at a time while
+        # they exceed the post-compaction budget (always keeping the newest).
+        recent_lens = self._msg_lens[-10:]
+        recent_chars = sum(recent_lens)
+        keep = len(recent_lens)
+        while keep > 2 and recent_chars > COMPACTED_RECENT_CHARS:
+            recent_chars -= recent_lens[-keep] + recent_lens[-keep + 1]
+            keep -= 2
+        recent = self.conversation[-keep:]
 
         compacted = [system_msg]
-        if first_user and first_user not in recent:
-            compacted.append(first_user)
+        # The conversation only grows by appending, so index 1 is outside the
+        # recent window exactly when the window starts after it.
+        if len(self.conversation) - keep > 1:
+            compacted.append(self.conversation[1])
 
         # Add a summary of what was compacted.
         compacted.append(LLMMessage(
@@ -467,26 +570,42 @@ class Planner:
         ))
 
         compacted.extend(recent)
-        self.conversation = compacted
+        self._set_conversation(compacted)
 
         logger.info(
             "Conversation compacted: %d messages, %d chars",
             len(self.conversation),
-            sum(len(m.content) for m in self.conversation),
+            self._conv_chars,
         )
 
-    def _project_has_source_files(self) -> bool:
-        """Check if the output project contains actual source code files (not just docs)."""
-        state = read_project_state(self.config.output_dir)
+    def _prune_message(self, content: str) -> str:
+        """Drop blank lines, oversized dump lines and known file-tree entries."""
+        known_files = self._prev_file_tree
+        return "\n".join(
+            line for line in content.split("\n")
+            if line.strip()
+            and len(line) <= PRUNE_LINE_MAX_CHARS
+            and line not in known_files
+        )
+
+    def _project_has_source_files(self, state: ProjectState | None = None) -> bool:
+        """Check if the output project contains actual source code files (not just docs).
+
+        Defaults to the state the last planning call read, since nothing is
+        running that could have changed it by the time this is asked.
+        """
+        if state is None:
+            state = self._last_state or read_project_state(self.config.output_dir)
         for f in state.file_tree:
-            ext = "." + f.rsplit(".", 1)[-1].lower() if "." in f else ""
-            if ext in _SOURCE_EXTENSIONS:
+            if f.lower().endswith(_SOURCE_EXTENSIONS):
                 return True
         return False
 
     def inject_tasks(self, tasks: list[Task]) -> None:
         """Called by the reconciler to inject fix tasks into the next planning cycle."""
         self._injected_tasks.extend(tasks)
+        self._wakeup.set()
 
     def stop(self) -> None:
         self._running = False
+        self._wakeup.set()
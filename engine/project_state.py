@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import stat
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 logger = logging.getLogger("agentswarm.project_state")
 
@@ -12,14 +16,14 @@ MAX_FILE_TREE_ENTRIES = 500
 MAX_FILE_CONTENT_CHARS = 30_000
 
 # Directories to skip when walking the project.
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     ".git", "node_modules", "__pycache__", ".venv", "venv",
     ".mypy_cache", ".pytest_cache", "dist", "build", ".turbo",
     ".next", ".nuxt", "target",
-}
+})
 
 # Binary extensions that we don't include in file content reads.
-BINARY_EXTENSIONS = {
+BINARY_EXTENSIONS = frozenset({
     ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".svg",
     ".woff", ".woff2", ".ttf", ".eot", ".otf",
     ".zip", ".tar", ".gz", ".bz2", ".xz", ".7z",
@@ -27,7 +31,7 @@ BINARY_EXTENSIONS = {
     ".pyc", ".pyo", ".class", ".jar",
     ".mp3", ".mp4", ".wav", ".avi", ".mov",
     ".pdf", ".doc", ".docx", ".xls", ".xlsx",
-}
+})
 
 
 @dataclass
@@ -36,33 +40,74 @@ class ProjectState:
     file_contents: dict[str, str] = field(default_factory=dict)  # path → content
 
 
-def read_project_state(output_dir: Path) -> ProjectState:
-    """Walk output_dir recursively, return the file tree."""
-    if not output_dir.exists():
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return ProjectState(file_tree=[])
+# output_dir → (its mtime_ns, state). The mtime catches top-level changes;
+# writes deeper in the tree must call mark_dirty().
+_state_cache: dict[Path, tuple[int, ProjectState]] = {}
 
-    files: list[str] = []
 
-    for p in sorted(output_dir.rglob("*")):
-        if p.is_dir():
-            continue
+def mark_dirty(output_dir: Path) -> None:
+    """Drop the cached state for output_dir after writing files into it."""
+    _state_cache.pop(output_dir, None)
 
-        rel = p.relative_to(output_dir).as_posix()
 
-        # Skip hidden/build directories.
-        parts = rel.split("/")
-        if any(part in SKIP_DIRS or part.startswith(".") for part in parts):
-            continue
+def read_project_state(output_dir: Path) -> ProjectState:
+    """Walk output_dir recursively, return the file tree.
+
+    The result is cached until output_dir's mtime changes or mark_dirty() is
+    called, so callers must treat it as read-only.
+    """
+    try:
+        mtime = output_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return ProjectState(file_tree=[])
 
-        files.append(rel)
+    cached = _state_cache.get(output_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    files = _walk_files(output_dir)
 
     if len(files) > MAX_FILE_TREE_ENTRIES:
         truncated = len(files) - MAX_FILE_TREE_ENTRIES
         files = files[:MAX_FILE_TREE_ENTRIES]
         files.append(f"... ({truncated} more files)")
 
-    return ProjectState(file_tree=files)
+    state = ProjectState(file_tree=files)
+    _state_cache[output_dir] = (mtime, state)
+    return state
+
+
+def _walk_files(output_dir: Path) -> list[str]:
+    """Relative POSIX paths of every file under output_dir, in path order.
+
+    Hidden and SKIP_DIRS entries are pruned before descending, so e.g.
+    node_modules is never listed; symlinked directories aren't followed.
+    """
+    files: list[str] = []
+    stack = [("", os.fspath(output_dir))]
+
+    while stack:
+        prefix, path = stack.pop()
+        try:
+            it = os.scandir(path)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                name = entry.name
+                if name in SKIP_DIRS or name[0] == ".":
+                    continue
+                rel = prefix + name
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append((rel + "/", entry.path))
+                else:
+                    files.append(rel)
+
+    # Same order as sorting Path objects: component by component.
+    files.sort(key=lambda rel: rel.split("/"))
+    return files
 
 
 def read_file_contents(
@@ -74,21 +119,50 @@ def read_file_contents(
     contents: dict[str, str] = {}
 
     for rel_path in paths:
-        full = output_dir / rel_path
-        if not full.is_file():
-            continue
-
-        ext = full.suffix.lower()
-        if ext in BINARY_EXTENSIONS:
-            contents[rel_path] = f"(binary file, {full.stat().st_size} bytes)"
-            continue
-
-        try:
-            text = full.read_text(encoding="utf-8", errors="replace")
-            if len(text) > max_chars:
-                text = text[:max_chars] + "\n... (truncated)"
+        text = _read_one(output_dir, rel_path, max_chars)
+        if text is not None:
             contents[rel_path] = text
-        except Exception:
-            logger.warning("Could not read %s", rel_path)
 
     return contents
+
+
+async def read_file_contents_async(
+    output_dir: Path,
+    paths: list[str],
+    max_chars: int = MAX_FILE_CONTENT_CHARS,
+    concurrency: int = 16,
+) -> dict[str, str]:
+    """Like read_file_contents(), but overlaps the per-file reads on worker threads."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def read(rel_path: str) -> Optional[str]:
+        async with sem:
+            return await asyncio.to_thread(_read_one, output_dir, rel_path, max_chars)
+
+    results = await asyncio.gather(*(read(p) for p in paths))
+    # Keep the caller's path order, same as the sync version.
+    return {p: text for p, text in zip(paths, results) if text is not None}
+
+
+def _read_one(output_dir: Path, rel_path: str, max_chars: int) -> Optional[str]:
+    full = output_dir / rel_path
+    # One stat answers both "is it a regular file" and, for binaries, the size.
+    try:
+        st = full.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    ext = full.suffix.lower()
+    if ext in BINARY_EXTENSIONS:
+        return f"(binary file, {st.st_size} bytes)"
+
+    try:
+        text = full.read_text(encoding="utf-8", errors="replace")
+    except Exception:
+        logger.warning("Could not read %s", rel_path)
+        return None
+    if len(text) > max_chars:
+        text = text[:max_chars] + "\n... (truncated)"
+    return text
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import stat
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -12,29 +13,38 @@ from .config import Config
 from .events import EngineEvent, EventBus, EventType
 from .gemini import GeminiClient, LLMMessage
 from .parsing import parse_llm_task_array
-from .project_state import read_project_state, read_file_contents
+from .project_state import read_file_contents_async, read_project_state
 from .types import Handoff, Task, TaskStatus, TeamRole
 
 logger = logging.getLogger("agentswarm.reconciler")
 
 # Asset file extensions that should never exist in the project.
-ASSET_EXTENSIONS = {
+ASSET_EXTENSIONS = frozenset({
     ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".ico", ".webp",
     ".ttf", ".otf", ".woff", ".woff2", ".eot",
     ".mp3", ".wav", ".ogg", ".flac", ".aac",
     ".mp4", ".avi", ".mov", ".webm",
-}
+})
 
-# Patterns that indicate asset file loading in code.
+# Source files scanned for TODOs, asset loading and bare imports.
+SOURCE_EXTENSIONS = frozenset({
+    ".py", ".ts", ".js", ".tsx", ".jsx", ".java", ".rs", ".go", ".c", ".cpp", ".h",
+})
+
+# Patterns that indicate asset file loading in code, each paired with a
+# lower-case substring every match contains. The case-insensitive regexes
+# can't skip ahead to a literal, so files lacking the substring skip them.
 ASSET_LOAD_PATTERNS = [
-    re.compile(r'pygame\.image\.load\s*\('),
-    re.compile(r'pygame\.font\.Font\s*\(\s*["\'][^"\']+\.(ttf|otf|woff)', re.IGNORECASE),
-    re.compile(r'pygame\.mixer\.\w+\.load\s*\('),
-    re.compile(r'open\s*\([^)]*\.(png|jpg|jpeg|gif|bmp|svg|ttf|wav|mp3|ogg)', re.IGNORECASE),
+    ("pygame.image.load", re.compile(r'pygame\.image\.load\s*\(')),
+    ("pygame.font.font", re.compile(r'pygame\.font\.Font\s*\(\s*["\'][^"\']+\.(ttf|otf|woff)', re.IGNORECASE)),
+    ("pygame.mixer.", re.compile(r'pygame\.mixer\.\w+\.load\s*\(')),
+    ("open", re.compile(r'open\s*\([^)]*\.(png|jpg|jpeg|gif|bmp|svg|ttf|wav|mp3|ogg)', re.IGNORECASE)),
 ]
 
-# Pattern for bare (non-relative) intra-package imports.
-BARE_IMPORT_PATTERN = re.compile(r'^from\s+(?!\.)[a-z_][a-z0-9_]*\s+import\s+', re.MULTILINE)
+# Pattern for bare (non-relative) imports; group 1 is the module name. It
+# starts with a literal so re can skip ahead to candidates; callers check that
+# only indentation precedes the match on its line.
+BARE_IMPORT_PATTERN = re.compile(r'from [ \t]*([A-Za-z_][\w.]*)[ \t]* import ')
 
 
 class Reconciler:
@@ -56,6 +66,9 @@ class Reconciler:
         self.on_fix_tasks: Optional[Callable[[list[Task]], None]] = None
         self._task_counter = 0
         self.event_bus = event_bus
+        # rel_path → (mtime_ns, size, text issues, bare imports) from the
+        # last sweep that read the file.
+        self._scan_cache: dict[str, tuple[int, int, list[str], list[tuple[str, int]]]] = {}
 
     def _emit(self, event: EngineEvent) -> None:
         if self.event_bus:
@@ -82,7 +95,7 @@ class Reconciler:
         if not state.file_tree:
             return []
 
-        issues = self._scan_for_issues(state.file_tree)
+        issues = await self._scan_for_issues(state.file_tree)
         if not issues:
             logger.debug("Reconciler sweep: no issues found")
             return []
@@ -95,7 +108,7 @@ class Reconciler:
                 if f in issue:
                     problem_files.add(f)
 
-        file_contents = read_file_contents(self.output_dir, list(problem_files))
+        file_contents = await read_file_contents_async(self.output_dir, list(problem_files))
 
         context_str = ""
         if file_contents:
@@ -133,77 +146,27 @@ class Reconciler:
 
         return tasks[:5]  # Max 5 fix tasks per sweep.
 
-    def _scan_for_issues(self, file_tree: list[str]) -> str:
-        """Scan output_project/ for structural issues."""
-        issues: list[str] = []
+    async def _scan_for_issues(self, file_tree: list[str], concurrency: int = 8) -> str:
+        """Scan output_project/ for structural issues.
 
-        for rel_path in file_tree:
-            if rel_path.startswith("..."):
-                continue
+        Files are scanned on worker threads so large trees don't stall the
+        event loop; issues keep file_tree order.
+        """
+        # Shared by all scans so sibling modules reuse one __init__.py lookup.
+        # Concurrent misses at worst repeat the exists() check.
+        package_dirs: dict[Path, bool] = {}
+        sem = asyncio.Semaphore(concurrency)
 
-            full = self.output_dir / rel_path
+        async def scan(rel_path: str) -> list[str]:
+            async with sem:
+                return await asyncio.to_thread(self._scan_one_file, rel_path, package_dirs)
 
-            # 1. Check for asset files that should not exist.
-            ext = full.suffix.lower()
-            if ext in ASSET_EXTENSIONS:
-                issues.append(f"ASSET FILE VIOLATION: {rel_path} — external asset files are forbidden. Must be replaced with programmatic code.")
-                continue
+        results = await asyncio.gather(*(scan(p) for p in file_tree if not p.startswith("...")))
+        issues = [issue for file_issues in results for issue in file_issues]
 
-            # 2. Check for empty files.
-            try:
-                if full.is_file() and full.stat().st_size == 0:
-                    issues.append(f"Empty file: {rel_path}")
-                    continue
-            except OSError:
-                continue
-
-            # 3. Scan source files for deeper issues.
-            if ext in {".py", ".ts", ".js", ".tsx", ".jsx", ".java", ".rs", ".go", ".c", ".cpp", ".h"}:
-                try:
-                    text = full.read_text(encoding="utf-8", errors="replace")
-                except Exception:
-                    continue
-
-                # Check for TODO/placeholder markers.
-                if "TODO: implement" in text or "# TODO" in text.upper():
-                    count = text.upper().count("TODO")
-                    issues.append(f"Contains {count} TODO markers: {rel_path}")
-
-                if "pass  # placeholder" in text:
-                    issues.append(f"Contains placeholder pass statements: {rel_path}")
-
-                # Check for asset file loading in code.
-                for pattern in ASSET_LOAD_PATTERNS:
-                    match = pattern.search(text)
-                    if match:
-                        issues.append(f"ASSET LOADING in code: {rel_path} — found '{match.group()}'. Must use programmatic shapes/system fonts instead.")
-
-                # Check for bare imports (potential intra-package issue).
-                if ext == ".py":
-                    # Determine if this file is inside a package (has __init__.py nearby).
-                    parent = full.parent
-                    is_in_package = (parent / "__init__.py").exists()
-
-                    if is_in_package:
-                        for line_no, line in enumerate(text.splitlines(), 1):
-                            stripped = line.strip()
-                            if stripped.startswith("from ") and " import " in stripped:
-                                # Skip stdlib and known third-party imports.
-                                module = stripped.split("from ", 1)[1].split(" import")[0].strip()
-                                if (
-                                    not module.startswith(".")
-                                    and not module.startswith("__")
-                                    and module not in _STDLIB_MODULES
-                                    and module.split(".")[0] not in _KNOWN_THIRD_PARTY
-                                ):
-                                    # Check if it looks like an intra-package import.
-                                    potential_file = parent / (module.replace(".", "/") + ".py")
-                                    if potential_file.exists() or (parent / module / "__init__.py").exists():
-                                        issues.append(
-                                            f"BARE IMPORT in {rel_path}:{line_no} — "
-                                            f"'from {module} import ...' should be 'from .{module} import ...'. "
-                                            f"Use relative imports within packages."
-                                        )
+        # Forget files that are gone so the cache tracks the current tree.
+        for rel_path in self._scan_cache.keys() - set(file_tree):
+            del self._scan_cache[rel_path]
 
         if not issues:
             return ""
@@ -216,12 +179,129 @@ class Reconciler:
             + "\n\nGenerate targeted fix tasks as a JSON array. Include the NO ASSETS reminder in every fix task."
         )
 
+    def _scan_one_file(self, rel_path: str, package_dirs: dict[Path, bool]) -> list[str]:
+        """Return the issues found in a single file of output_project/."""
+        issues: list[str] = []
+
+        # 1. Check for asset files that should not exist. The extension is
+        # sliced from the string (same rules as Path.suffix) so asset paths
+        # never build a Path.
+        name_start = rel_path.rfind("/") + 1
+        dot = rel_path.rfind(".", name_start)
+        ext = rel_path[dot:].lower() if name_start < dot < len(rel_path) - 1 else ""
+        if ext in ASSET_EXTENSIONS:
+            issues.append(f"ASSET FILE VIOLATION: {rel_path} — external asset files are forbidden. Must be replaced with programmatic code.")
+            return issues
+
+        full = self.output_dir / rel_path
+
+        # 2. Check for empty files.
+        try:
+            st = full.stat()
+        except OSError:
+            return issues
+        if not stat.S_ISREG(st.st_mode):
+            return issues
+        if st.st_size == 0:
+            issues.append(f"Empty file: {rel_path}")
+            return issues
+
+        # 3. Scan source files for deeper issues.
+        if ext not in SOURCE_EXTENSIONS:
+            return issues
+
+        # Unchanged files reuse the last sweep's findings instead of being
+        # re-read; only the checks that depend on other files are redone.
+        cached = self._scan_cache.get(rel_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            text_issues, imports = cached[2], cached[3]
+        else:
+            try:
+                text = full.read_text(encoding="utf-8", errors="replace")
+            except Exception:
+                return issues
+            text_issues, imports = self._scan_source_text(rel_path, text, ext == ".py")
+            self._scan_cache[rel_path] = (st.st_mtime_ns, st.st_size, text_issues, imports)
+        issues.extend(text_issues)
+
+        # Check for bare imports (potential intra-package issue).
+        if imports:
+            # Determine if this file is inside a package (has __init__.py nearby).
+            parent = full.parent
+            is_in_package = package_dirs.get(parent)
+            if is_in_package is None:
+                is_in_package = package_dirs[parent] = (parent / "__init__.py").exists()
+
+            if is_in_package:
+                for module, line_no in imports:
+                    # Check if it looks like an intra-package import.
+                    potential_file = parent / (module.replace(".", "/") + ".py")
+                    if potential_file.exists() or (parent / module / "__init__.py").exists():
+                        issues.append(
+                            f"BARE IMPORT in {rel_path}:{line_no} — "
+                            f"'from {module} import ...' should be 'from .{module} import ...'. "
+                            f"Use relative imports within packages."
+                        )
+
+        return issues
+
+    @staticmethod
+    def _scan_source_text(
+        rel_path: str, text: str, is_python: bool
+    ) -> tuple[list[str], list[tuple[str, int]]]:
+        """Checks that depend only on a file's text.
+
+        Returns the issues found plus, for Python files, each bare import's
+        (module, line number) still to be tested against the package.
+        """
+        issues: list[str] = []
+
+        # One lower-cased copy serves every case-insensitive check.
+        lowered = text.lower()
+
+        # Check for TODO/placeholder markers.
+        if "TODO: implement" in text or "# todo" in lowered:
+            count = lowered.count("todo")
+            issues.append(f"Contains {count} TODO markers: {rel_path}")
+
+        if "pass  # placeholder" in text:
+            issues.append(f"Contains placeholder pass statements: {rel_path}")
+
+        # Check for asset file loading in code.
+        for needle, pattern in ASSET_LOAD_PATTERNS:
+            if needle not in lowered:
+                continue
+            match = pattern.search(text)
+            if match:
+                issues.append(f"ASSET LOADING in code: {rel_path} — found '{match.group()}'. Must use programmatic shapes/system fonts instead.")
+
+        imports: list[tuple[str, int]] = []
+        if is_python:
+            line_no, counted_to = 1, 0
+            for match in BARE_IMPORT_PATTERN.finditer(text):
+                start = match.start()
+                if text[text.rfind("\n", 0, start) + 1:start].strip():
+                    continue  # not at the start of a statement
+                module = match.group(1)
+                # Skip stdlib and known third-party imports.
+                if (
+                    module.startswith("__")
+                    or module in _STDLIB_MODULES
+                    or module.split(".")[0] in _KNOWN_THIRD_PARTY
+                ):
+                    continue
+                line_no += text.count("\n", counted_to, start)
+                counted_to = start
+                imports.append((module, line_no))
+
+        return issues, imports
+
     def stop(self) -> None:
         self._running = False
 
 
 # Common stdlib module names (not exhaustive, but covers common false positives).
-_STDLIB_MODULES = {
+_STDLIB_MODULES = frozenset({
     "os", "sys", "re", "json", "math", "random", "time", "datetime",
     "pathlib", "collections", "itertools", "functools", "typing",
     "abc", "io", "copy", "enum", "dataclasses", "logging", "unittest",
@@ -232,14 +312,14 @@ _STDLIB_MODULES = {
     "decimal", "fractions", "statistics", "pprint", "dis", "inspect",
     "importlib", "pkgutil", "platform", "signal", "queue", "heapq",
     "bisect", "array", "weakref", "types", "operator",
-}
+})
 
 # Common third-party packages (top-level import names).
-_KNOWN_THIRD_PARTY = {
+_KNOWN_THIRD_PARTY = frozenset({
     "pygame", "flask", "django", "fastapi", "numpy", "pandas", "scipy",
     "matplotlib", "requests", "httpx", "aiohttp", "sqlalchemy", "pydantic",
     "click", "rich", "pytest", "dotenv", "PIL", "cv2", "torch",
     "tensorflow", "sklearn", "celery", "redis", "boto3", "paramiko",
     "yaml", "toml", "bs4", "lxml", "jinja2", "werkzeug", "uvicorn",
     "gunicorn", "starlette", "anyio", "trio", "attr", "attrs",
-}
+})
@@ -4,15 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
-from .events import EventBus, EventType
+from .events import EventBus, EventBusClosed, EventType, encode_event
 
 logger = logging.getLogger("agentswarm.server")
 
-app = FastAPI(title="AgentSwarm Engine")
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    yield
+    # Builds share one GeminiClient (see main._get_client); release its pool.
+    from .main import close_shared_client
+
+    await close_shared_client()
+
+
+app = FastAPI(title="AgentSwarm Engine", lifespan=_lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -35,25 +46,29 @@ async def engine_websocket(ws: WebSocket):
         conversation = data.get("conversation", [])
 
         event_bus = EventBus()
-        queue = event_bus.subscribe()
+        subscription = event_bus.subscribe()
 
         from .main import run_from_conversation
 
         engine_task = asyncio.create_task(run_from_conversation(conversation, event_bus))
+        # Ends the subscription as soon as the run finishes, even if it fails
+        # before emitting ENGINE_DONE.
+        engine_task.add_done_callback(lambda _: event_bus.close())
 
         try:
             while True:
                 try:
-                    event = await asyncio.wait_for(queue.get(), timeout=2.0)
-                    await ws.send_json(event.to_dict())
+                    event = await asyncio.wait_for(subscription.get(), timeout=2.0)
+                    await ws.send_text(encode_event(event))
                     if event.type == EventType.ENGINE_DONE:
                         break
+                except EventBusClosed:
+                    if not engine_task.cancelled() and engine_task.exception():
+                        await ws.send_json(
+                            {"type": "error", "message": str(engine_task.exception())}
+                        )
+                    break
                 except asyncio.TimeoutError:
-                    if engine_task.done():
-                        exc = engine_task.exception()
-                        if exc:
-                            await ws.send_json({"type": "error", "message": str(exc)})
-                        break
                     # Send heartbeat so the connection stays alive.
                     await ws.send_json({"type": "heartbeat"})
         except WebSocketDisconnect:
@@ -63,7 +78,7 @@ async def engine_websocket(ws: WebSocket):
             except (asyncio.CancelledError, Exception):
                 pass
         finally:
-            event_bus.unsubscribe(queue)
+            event_bus.unsubscribe(subscription)
 
     except WebSocketDisconnect:
         pass
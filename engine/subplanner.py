@@ -9,7 +9,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
+from collections import deque
 from typing import TYPE_CHECKING
 
 from .config import Config
@@ -35,6 +37,10 @@ MAX_CONSECUTIVE_ERRORS = 5
 MAX_SUBPLANNER_ITERATIONS = 20
 MAX_HANDOFF_SUMMARY_CHARS = 300
 MAX_FILES_PER_HANDOFF = 30
+MAX_AGGREGATED_NOTES = 100  # concerns / suggestions kept per aggregated handoff
+# Follow-up exchanges kept verbatim; older ones are folded into one summary
+# so each call doesn't re-send the whole decomposition history.
+MAX_FOLLOW_UP_EXCHANGES = 3
 
 
 class Subplanner:
@@ -58,6 +64,10 @@ class Subplanner:
         if self.event_bus:
             self.event_bus.emit(event)
 
+    def _emit_many(self, events: list[EngineEvent]) -> None:
+        if self.event_bus:
+            self.event_bus.emit_many(events)
+
     def should_decompose(self, task: Task, depth: int) -> bool:
         """Check if a task warrants decomposition."""
         if depth >= MAX_DEPTH:
@@ -75,14 +85,18 @@ class Subplanner:
             len(parent_task.scope),
         )
 
-        pending_handoffs: list[tuple[Task, Handoff]] = []
+        pending_handoffs: deque[tuple[Task, Handoff]] = deque()
+        # Set by subtasks as they finish, so the loop reacts without polling.
+        wakeup = asyncio.Event()
         all_handoffs: list[Handoff] = []
         handoffs_since_last_plan: list[Handoff] = []
         active_tasks: set[str] = set()
         dispatched_ids: set[str] = set()
         all_subtasks: list[Task] = []
+        subtasks_by_id: dict[str, Task] = {}
 
         conversation = [LLMMessage(role="system", content=self.system_prompt)]
+        sent_tree: list[str] | None = []  # file tree as of the last message sent
         scratchpad = ""
         iteration = 0
         planning_done = False
@@ -105,11 +119,21 @@ class Subplanner:
                         if iteration == 0:
                             msg = self._build_initial_message(parent_task, state.file_tree, depth)
                         else:
+                            # [system, initial, reply, then follow-up exchanges].
+                            summary = None
+                            if len(conversation) > 3 + 2 * MAX_FOLLOW_UP_EXCHANGES:
+                                conversation, summary = self._compact_conversation(
+                                    conversation, scratchpad, dispatched_ids, active_tasks, all_handoffs,
+                                )
+                                sent_tree = None  # dropped deltas: resend the full tree
                             msg = self._build_follow_up_message(
-                                state.file_tree, handoffs_since_last_plan, active_tasks, all_subtasks,
+                                state.file_tree, sent_tree, handoffs_since_last_plan, active_tasks, subtasks_by_id,
                             )
+                            if summary:
+                                msg = f"{summary}\n\n{msg}"
 
                         conversation.append(LLMMessage(role="user", content=msg))
+                        sent_tree = state.file_tree
 
                         logger.info(
                             "Subplanner iteration %d for %s (handoffs=%d, active=%d)",
@@ -142,14 +166,17 @@ class Subplanner:
                                 planning_done = True
                         elif subtasks:
                             all_subtasks.extend(subtasks)
+                            subtasks_by_id.update((st.id, st) for st in subtasks)
                             self._dispatch_subtasks(
                                 subtasks, parent_task, depth,
-                                pending_handoffs, active_tasks, dispatched_ids,
+                                pending_handoffs, active_tasks, dispatched_ids, wakeup,
                             )
 
                     except Exception as e:
                         consecutive_errors += 1
-                        backoff = min(BACKOFF_BASE_S * (2 ** (consecutive_errors - 1)), BACKOFF_MAX_S)
+                        backoff = random.uniform(
+                            0, min(BACKOFF_BASE_S * (2 ** (consecutive_errors - 1)), BACKOFF_MAX_S)
+                        )
                         logger.error(
                             "Subplanner plan failed (attempt %d) for %s: %s",
                             consecutive_errors,
@@ -166,15 +193,16 @@ class Subplanner:
                 if not planning_done and not active_tasks and iteration > 0 and not handoffs_since_last_plan:
                     break
 
-                await asyncio.sleep(LOOP_SLEEP_S)
+                await self._wait_for_wakeup(wakeup)
 
             # Final drain.
             self._collect_handoffs(pending_handoffs, all_handoffs, handoffs_since_last_plan, active_tasks)
 
-            # Wait for stragglers.
+            # Wait for stragglers, draining after each wake-up so the last
+            # handoff is collected before the loop sees no active tasks.
             while active_tasks:
+                await self._wait_for_wakeup(wakeup)
                 self._collect_handoffs(pending_handoffs, all_handoffs, handoffs_since_last_plan, active_tasks)
-                await asyncio.sleep(LOOP_SLEEP_S)
 
             return self._aggregate_handoffs(parent_task, all_subtasks, all_handoffs)
 
@@ -211,11 +239,15 @@ class Subplanner:
     def _build_follow_up_message(
         self,
         file_tree: list[str],
+        prev_file_tree: list[str] | None,
         new_handoffs: list[Handoff],
         active_tasks: set[str],
-        all_subtasks: list[Task],
+        subtasks_by_id: dict[str, Task],
     ) -> str:
-        parts = [f"## Updated Project File Tree\n{chr(10).join(file_tree)}\n"]
+        # Earlier turns are never rewritten, so the transcript stays a stable
+        # prefix; each follow-up carries only what changed, with the file
+        # tree as a delta against the last one sent.
+        parts: list[str] = []
 
         if new_handoffs:
             parts.append(f"## New Subtask Handoffs ({len(new_handoffs)} since last plan)")
@@ -223,28 +255,67 @@ class Subplanner:
                 parts.append(f"### Task {h.task_id} — {h.status}")
                 summary = h.summary[:MAX_HANDOFF_SUMMARY_CHARS]
                 parts.append(f"Summary: {summary}")
-                files = [str(f) for f in h.files_changed[:MAX_FILES_PER_HANDOFF]]
-                parts.append(f"Files changed: {', '.join(files)}")
+                parts.append("Files changed: " + ", ".join(map(str, h.files_changed[:MAX_FILES_PER_HANDOFF])))
                 if h.concerns:
-                    parts.append(f"Concerns: {'; '.join(str(c) for c in h.concerns)}")
+                    parts.append("Concerns: " + "; ".join(map(str, h.concerns)))
                 if h.suggestions:
-                    parts.append(f"Suggestions: {'; '.join(str(s) for s in h.suggestions)}")
+                    parts.append("Suggestions: " + "; ".join(map(str, h.suggestions)))
                 parts.append("")
 
         if active_tasks:
             parts.append(f"## Currently Active Subtasks ({len(active_tasks)})")
             for tid in sorted(active_tasks):
-                t = next((st for st in all_subtasks if st.id == tid), None)
+                t = subtasks_by_id.get(tid)
                 if t:
                     parts.append(f"- {tid}: {t.description[:120]}")
             parts.append("")
 
+        # The tree is sorted, so an unchanged one compares equal.
+        if prev_file_tree is None:
+            parts.append("## Project File Tree\n" + ("\n".join(file_tree) or "(empty project)"))
+        elif file_tree == prev_file_tree:
+            parts.append("## Project File Tree\nNo changes since last plan.")
+        else:
+            current, previous = set(file_tree), set(prev_file_tree)
+            parts.append("## Project File Tree Changes")
+            new_files = sorted(current - previous)
+            removed_files = sorted(previous - current)
+            if new_files:
+                parts.append(f"### New files ({len(new_files)})\n" + "\n".join(new_files))
+            if removed_files:
+                parts.append(f"### Removed files ({len(removed_files)})\n" + "\n".join(removed_files))
+        parts.append(f"Total files: {len(file_tree)}\n")
+
         parts.append(
             "Continue planning. Review handoffs and emit next batch. "
             "Return empty tasks array if all work is done."
         )
         return "\n".join(parts)
 
+    @staticmethod
+    def _compact_conversation(
+        conversation: list[LLMMessage],
+        scratchpad: str,
+        dispatched_ids: set[str],
+        active_tasks: set[str],
+        handoffs: list[Handoff],
+    ) -> tuple[list[LLMMessage], str]:
+        """Keep system, parent task, first plan and latest exchange; summarize the rest.
+
+        Returns the trimmed conversation and a summary of what was dropped,
+        to be prepended to the next user turn so roles keep alternating.
+        """
+        kept = [*conversation[:3], *conversation[-2:]]
+        summary = "\n".join([
+            f"[Context compacted — {len(conversation) - len(kept)} earlier messages removed. "
+            f"Current scratchpad: {scratchpad[:1000]}. "
+            f"Subtasks dispatched: {len(dispatched_ids)}. "
+            f"Active subtasks: {len(active_tasks)}. "
+            f"Handoffs so far: {len(handoffs)}.]",
+            *_cap_notes([f"- [{h.task_id}] ({h.status}): {h.summary[:120]}" for h in handoffs]),
+        ])
+        return kept, summary
+
     def _build_subtasks(
         self,
         raw_tasks: list[RawTaskInput],
@@ -313,10 +384,12 @@ class Subplanner:
         subtasks: list[Task],
         parent: Task,
         current_depth: int,
-        pending_handoffs: list[tuple[Task, Handoff]],
+        pending_handoffs: deque[tuple[Task, Handoff]],
         active_tasks: set[str],
         dispatched_ids: set[str],
+        wakeup: asyncio.Event,
     ) -> None:
+        events: list[EngineEvent] = []
         for st in subtasks:
             dispatched_ids.add(st.id)
             active_tasks.add(st.id)
@@ -329,7 +402,7 @@ class Subplanner:
                 st.description[:100],
             )
 
-            self._emit(EngineEvent(
+            events.append(EngineEvent(
                 type=EventType.SUBTASK_DISPATCHED,
                 task_id=st.id,
                 parent_id=parent.id,
@@ -338,16 +411,19 @@ class Subplanner:
             ))
 
             asyncio.create_task(
-                self._execute_subtask(st, parent, current_depth, pending_handoffs, active_tasks)
+                self._execute_subtask(st, parent, current_depth, pending_handoffs, active_tasks, wakeup)
             )
 
+        self._emit_many(events)
+
     async def _execute_subtask(
         self,
         subtask: Task,
         parent: Task,
         current_depth: int,
-        pending_handoffs: list[tuple[Task, Handoff]],
+        pending_handoffs: deque[tuple[Task, Handoff]],
         active_tasks: set[str],
+        wakeup: asyncio.Event,
     ) -> None:
         try:
             if self.should_decompose(subtask, current_depth + 1):
@@ -376,16 +452,30 @@ class Subplanner:
             ))
         finally:
             active_tasks.discard(subtask.id)
+            wakeup.set()
+
+    @staticmethod
+    async def _wait_for_wakeup(wakeup: asyncio.Event) -> None:
+        """Sleep until a subtask finishes, capped at one loop tick.
+
+        The cap keeps the capacity check re-running when workers free up
+        elsewhere, which nothing here signals.
+        """
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=LOOP_SLEEP_S)
+        except asyncio.TimeoutError:
+            pass
+        wakeup.clear()
 
     @staticmethod
     def _collect_handoffs(
-        pending: list[tuple[Task, Handoff]],
+        pending: deque[tuple[Task, Handoff]],
         all_handoffs: list[Handoff],
         since_last_plan: list[Handoff],
         active_tasks: set[str],
     ) -> None:
         while pending:
-            task, handoff = pending.pop(0)
+            task, handoff = pending.popleft()
             all_handoffs.append(handoff)
             since_last_plan.append(handoff)
             active_tasks.discard(task.id)
@@ -405,11 +495,14 @@ class Subplanner:
         else:
             status = "blocked"
 
-        summary_parts = [f"[{h.task_id}] ({h.status}): {h.summary}" for h in handoffs]
+        # Child summaries may themselves be aggregates; cap each so nesting
+        # doesn't compound their size up the tree.
         summary = (
             f'Decomposed "{parent.description[:80]}" into {total} subtasks. '
             f"{completed} complete, {failed} failed, {total - completed - failed} other.\n\n"
-            + "\n".join(summary_parts)
+            + "\n".join(
+                f"[{h.task_id}] ({h.status}): {h.summary[:MAX_HANDOFF_SUMMARY_CHARS]}" for h in handoffs
+            )
         )
 
         all_files: set[str] = set()
@@ -430,8 +523,8 @@ class Subplanner:
             status=status,
             summary=summary,
             files_changed=sorted(all_files),
-            concerns=all_concerns,
-            suggestions=all_suggestions,
+            concerns=_cap_notes(all_concerns),
+            suggestions=_cap_notes(all_suggestions),
             metrics=HandoffMetrics(
                 tokens_used=total_tokens,
                 duration_ms=max_duration,
@@ -439,3 +532,11 @@ class Subplanner:
                 files_modified=sum(h.metrics.files_modified for h in handoffs),
             ),
         )
+
+
+def _cap_notes(notes: list[str]) -> list[str]:
+    """Trim to MAX_AGGREGATED_NOTES, noting how many were dropped."""
+    if len(notes) <= MAX_AGGREGATED_NOTES:
+        return notes
+    dropped = len(notes) - MAX_AGGREGATED_NOTES
+    return notes[:MAX_AGGREGATED_NOTES] + [f"... +{dropped} more"]
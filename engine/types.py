@@ -36,7 +36,7 @@ class Task:
     retry_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HandoffMetrics:
     files_created: int = 0
     files_modified: int = 0
@@ -44,7 +44,7 @@ class HandoffMetrics:
     duration_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Handoff:
     task_id: str
     status: str  # "complete" | "partial" | "blocked" | "failed"
@@ -55,14 +55,14 @@ class Handoff:
     metrics: HandoffMetrics = field(default_factory=HandoffMetrics)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileOperation:
     """A single file create/overwrite operation from a worker."""
     path: str       # relative to output_project/
     content: str    # full file content
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerResult:
     """Structured result from a worker Gemini API call."""
     handoff: Handoff
@@ -9,9 +9,9 @@ from pathlib import Path
 
 from .config import Config
 from .events import EngineEvent, EventBus, EventType
-from .gemini import GeminiClient, LLMMessage, RateLimitError
+from .gemini import GeminiClient, LLMMessage
 from .parsing import parse_worker_response
-from .project_state import read_file_contents, read_project_state
+from .project_state import mark_dirty, read_file_contents_async, read_project_state
 from .types import (
     FileOperation,
     Handoff,
@@ -154,7 +154,7 @@ class WorkerPool:
 
         # Build context — read ALL project files, not just scope files.
         state = read_project_state(self.output_dir)
-        all_contents = read_file_contents(self.output_dir, state.file_tree)
+        all_contents = await read_file_contents_async(self.output_dir, state.file_tree)
 
         user_prompt = self._build_worker_prompt(task, state.file_tree, all_contents)
 
@@ -184,16 +184,20 @@ class WorkerPool:
             # Apply file operations to disk.
             files_created = 0
             files_modified = 0
+            ensured_dirs: set[Path] = set()
             for op in result.file_operations:
-                target = self.output_dir / op.path
-                existed = target.exists()
-                target.parent.mkdir(parents=True, exist_ok=True)
-
                 # Block asset files from being written.
                 if self._is_asset_file(op.path):
                     logger.warning("Blocked asset file creation: %s (task %s)", op.path, task.id)
                     continue
 
+                target = self.output_dir / op.path
+                existed = target.exists()
+                # Sibling files share a parent; create each directory once.
+                if target.parent not in ensured_dirs:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    ensured_dirs.add(target.parent)
+
                 target.write_text(op.content, encoding="utf-8")
                 if existed:
                     files_modified += 1
@@ -201,6 +205,9 @@ class WorkerPool:
                     files_created += 1
                 logger.debug("  Wrote %s (%s)", op.path, "modified" if existed else "created")
 
+            if files_created:
+                mark_dirty(self.output_dir)
+
             # Update metrics on the handoff.
             result.handoff.metrics = HandoffMetrics(
                 tokens_used=response.total_tokens,
@@ -232,40 +239,6 @@ class WorkerPool:
 
             return result.handoff
 
-        except RateLimitError:
-            logger.warning("Rate-limited on task %s — will retry after backoff", task.id)
-            await asyncio.sleep(10)
-            try:
-                response = await self.client.complete(messages)
-                result = parse_worker_response(response.content, task.id)
-
-                files_created = 0
-                files_modified = 0
-                for op in result.file_operations:
-                    target = self.output_dir / op.path
-                    existed = target.exists()
-                    target.parent.mkdir(parents=True, exist_ok=True)
-
-                    if self._is_asset_file(op.path):
-                        logger.warning("Blocked asset file creation: %s (task %s)", op.path, task.id)
-                        continue
-
-                    target.write_text(op.content, encoding="utf-8")
-                    if existed:
-                        files_modified += 1
-                    else:
-                        files_created += 1
-
-                result.handoff.metrics = HandoffMetrics(
-                    tokens_used=response.total_tokens,
-                    duration_ms=int((time.time() - start) * 1000),
-                    files_created=files_created,
-                    files_modified=files_modified,
-                )
-                return result.handoff
-            except Exception as e2:
-                return self._failure_handoff(task.id, start, e2)
-
         except Exception as e:
             return self._failure_handoff(task.id, start, e)
 